@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from app.config.settings import SUMMARY_CACHE_PATH, SUMMARY_CACHE_MAX_ENTRIES
+from app.config.logging import logger
+
+
+class SummaryCache:
+    """
+    Persistent, content-addressed cache of LLM article summaries.
+    - Key: sha256 of (normalized content, prompt version, model)
+    - Size-bounded with least-recently-used eviction
+    - Hit / miss counters for the current process
+    Backed by a local SQLite file so it survives restarts and crashes.
+    """
+
+    def __init__(self, path: str = SUMMARY_CACHE_PATH, max_entries: int = SUMMARY_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_summaries_last_used ON summaries (last_used)"
+        )
+        self._size = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+    @staticmethod
+    def make_key(content: str, prompt_version: str, model: Optional[str]) -> str:
+        normalized = " ".join((content or "").split())
+        raw = f"{prompt_version}\x00{model or ''}\x00{normalized}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE summaries SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def put(self, key: str, value: dict):
+        row = (json.dumps(value), time.time(), key)
+
+        with self._lock:
+            # Only a new key grows the cache; a re-put of one just updates it
+            inserted = self._conn.execute(
+                "INSERT INTO summaries (value, last_used, key) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO NOTHING",
+                row,
+            ).rowcount
+
+            if not inserted:
+                self._conn.execute(
+                    "UPDATE summaries SET value = ?, last_used = ? WHERE key = ?", row
+                )
+                return
+
+            self._size += 1
+
+            if self._size > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        # Trim to 90% in one statement so eviction doesn't run on every put
+        keep = int(self.max_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM summaries WHERE key IN ("
+            " SELECT key FROM summaries ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (keep,),
+        )
+        self._size = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        logger.info(f"Summary cache evicted down to {self._size} entries")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": self._size,
+        }
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    """Process-wide cache shared by every Processor, so counters add up."""
+    global _default_cache
+
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = SummaryCache()
+
+    return _default_cache
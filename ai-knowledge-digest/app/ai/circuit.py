@@ -0,0 +1,141 @@
+import random
+import threading
+import time
+
+from app.config.logging import logger
+from app.config.settings import (
+    AI_CIRCUIT_FAILURE_THRESHOLD,
+    AI_CIRCUIT_RESET_SECONDS,
+    AI_RETRY_BUDGET_RATIO,
+    AI_RETRY_BUDGET_RESERVE,
+    RETRY_DELAY_SECONDS,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """The provider's circuit is open: the call was shed, not attempted."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a provider that keeps failing.
+    - closed: calls go through; `failure_threshold` consecutive failures open it
+    - open: allow() is False, callers fall back immediately
+    - half-open: after `reset_timeout` one probe call is let through;
+      success closes the circuit, failure re-opens it
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = AI_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = AI_CIRCUIT_RESET_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probing = False
+
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                logger.info("Circuit half-open, sending probe request")
+                return True
+
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("Circuit closed, provider recovered")
+
+            self.state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    f"Circuit open after {self._failures} failures, "
+                    f"falling back for {self.reset_timeout:.0f}s"
+                )
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries: every first attempt deposits `ratio`
+    of a retry, every retry withdraws one. Up to `reserve` retries can
+    be banked, so a quiet process may still retry, but during an outage
+    retries stay at ~ratio of traffic instead of multiplying it.
+    """
+
+    def __init__(self, ratio: float = AI_RETRY_BUDGET_RATIO, reserve: int = AI_RETRY_BUDGET_RESERVE):
+        self.ratio = ratio
+        self.reserve = reserve
+
+        self._balance = float(reserve)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance >= 1:
+                self._balance -= 1
+                return True
+            return False
+
+
+def backoff_delay(attempt: int, base: float = RETRY_DELAY_SECONDS, cap: float = 60) -> float:
+    """Exponential backoff with full jitter: uniform in [0, min(cap, base * 2^attempt)]."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+_breaker = None
+_budget = None
+_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    global _breaker
+
+    with _lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker()
+
+    return _breaker
+
+
+def get_retry_budget() -> RetryBudget:
+    global _budget
+
+    with _lock:
+        if _budget is None:
+            _budget = RetryBudget()
+
+    return _budget
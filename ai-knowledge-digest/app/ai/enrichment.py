@@ -0,0 +1,142 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select
+
+from app.ai.circuit import CircuitOpenError
+from app.ai.processor import Processor
+from app.config.logging import logger
+from app.config.settings import (
+    ENRICHMENT_WORKERS,
+    ENRICHMENT_BATCH_SIZE,
+    ENRICHMENT_MAX_ATTEMPTS,
+)
+from app.database.db import SessionLocal
+from app.database.models import Article
+from app.utils.topics import normalize_topic
+
+
+class EnrichmentWorker:
+    """
+    Drains articles saved in 'pending' state and writes back
+    summary, takeaways and topic.
+
+    Each worker thread has its own session and Processor and claims a
+    small batch with SELECT ... FOR UPDATE SKIP LOCKED, so workers never
+    process the same article and a crash only returns the claimed batch
+    to the queue. A claimed batch is summarized with Processor.summarize_batch().
+
+    An error or a fallback summary (provider down, unparseable reply) is
+    a failed attempt: the article stays 'pending' for a later run until
+    it reaches max_attempts, then is marked 'failed'. Each article is
+    attempted at most once per run. While the provider's circuit is open
+    nothing is attempted: the batch stays pending and the worker stops.
+    """
+
+    def __init__(
+        self,
+        workers: int = ENRICHMENT_WORKERS,
+        batch_size: int = ENRICHMENT_BATCH_SIZE,
+        max_attempts: int = ENRICHMENT_MAX_ATTEMPTS,
+    ):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+
+        self._attempted = set()
+        self._attempted_lock = threading.Lock()
+
+    def run(self) -> int:
+        """Drain the queue; returns the number of articles enriched."""
+        self._attempted = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="enrich"
+        ) as pool:
+            futures = [pool.submit(self._drain) for _ in range(self.workers)]
+            enriched = sum(f.result() for f in futures)
+
+        logger.info(f"Enriched {enriched} articles with {self.workers} workers")
+        return enriched
+
+    # --------------------------------------------------
+    # Worker loop
+    # --------------------------------------------------
+    def _drain(self) -> int:
+        processor = Processor()
+        db = SessionLocal()
+        enriched = 0
+
+        try:
+            while True:
+                batch = self._claim(db)
+                if not batch:
+                    break
+
+                # Packed into few multi-article requests, sent concurrently
+                results = processor.summarize_batch(
+                    [article.content_text or article.content_md or "" for article in batch]
+                )
+
+                for article, ai in zip(batch, results):
+                    if self._apply(article, ai):
+                        enriched += 1
+
+                db.commit()
+
+                if any(isinstance(ai, CircuitOpenError) for ai in results):
+                    logger.warning("AI provider circuit is open, enrichment worker stopping")
+                    break
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Enrichment worker stopped: {e}")
+
+        finally:
+            db.close()
+            # Each worker's client owns an HTTP session and executor threads
+            processor.client.close()
+
+        return enriched
+
+    def _claim(self, db) -> list[Article]:
+        stmt = (
+            select(Article)
+            .where(Article.enrichment_status == "pending")
+            .order_by(Article.created_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        # Failed articles stay pending: don't retry them within this run
+        with self._attempted_lock:
+            if self._attempted:
+                stmt = stmt.where(Article.id.not_in(list(self._attempted)))
+
+        batch = list(db.scalars(stmt))
+
+        with self._attempted_lock:
+            self._attempted.update(article.id for article in batch)
+
+        return batch
+
+    def _apply(self, article: Article, ai) -> bool:
+        # Shed, not attempted: left pending as is
+        if isinstance(ai, CircuitOpenError):
+            return False
+
+        if isinstance(ai, Exception) or Processor.is_fallback(ai):
+            article.enrichment_attempts = (article.enrichment_attempts or 0) + 1
+
+            if article.enrichment_attempts >= self.max_attempts:
+                article.enrichment_status = "failed"
+
+            reason = ai if isinstance(ai, Exception) else "fallback summary"
+            logger.error(f"AI processing failed for article {article.id}: {reason}")
+            return False
+
+        article.summary = ai.get("summary", "")
+        article.takeaways = ai.get("takeaways", [])
+        article.topic = normalize_topic(ai.get("topic"))
+        article.enrichment_status = "done"
+        return True
@@ -1,26 +1,66 @@
 # app/ai/openrouter_client.py
+import asyncio
 import requests
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from requests.adapters import HTTPAdapter
+
+from app.ai.circuit import (
+    CircuitBreaker,
+    RetryBudget,
+    get_circuit_breaker,
+    get_retry_budget,
+)
+from app.ai.ratelimit import (
+    AdaptiveConcurrency,
+    TokenBucket,
+    get_concurrency,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from app.config.metrics import OPENROUTER_REQUEST_SECONDS, OPENROUTER_SHORT_CIRCUITS
+from app.ingestion.normalize import estimate_tokens
+
+# 429 responses retried (after Retry-After) before giving up
+RATE_LIMIT_RETRIES = 3
 
 logger = logging.getLogger(__name__)
 
 class OpenRouterClient:
     """
-    OpenRouter API client with chat method for Processor class
+    OpenRouter API client with chat method for Processor class.
+    Requests go through a pooled keep-alive Session; achat() runs
+    completions concurrently, capped at max_concurrency in flight.
+    Every call passes the process-wide token bucket (requests/min and
+    tokens/min, honoring Retry-After) and an AIMD concurrency limit.
+    A shared circuit breaker short-circuits to the fallback while the
+    provider is down; 429 retries draw on the shared retry budget.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        limiter: Optional[TokenBucket] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+    ):
         from app.config.settings import (
             OPENROUTER_API_KEY,
             OPENROUTER_MODEL,
-            OPENROUTER_API_URL
+            OPENROUTER_API_URL,
+            OPENROUTER_MAX_CONCURRENCY,
+            REQUEST_TIMEOUT,
         )
         
         self.api_key = OPENROUTER_API_KEY
         self.model = OPENROUTER_MODEL
         self.base_url = OPENROUTER_API_URL
+        self.max_concurrency = max_concurrency or OPENROUTER_MAX_CONCURRENCY
+        self.timeout = REQUEST_TIMEOUT
         
         if not self.api_key or self.api_key == "":
             logger.warning("OPENROUTER_API_KEY is not set. AI features will not work.")
@@ -31,6 +71,25 @@ class OpenRouterClient:
             "HTTP-Referer": "http://localhost:8000",
             "X-Title": "AI Knowledge Digest Platform"
         }
+
+        # One keep-alive connection per concurrent call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency),
+        )
+
+        # achat() runs the blocking call here; the pool size is the cap
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="openrouter"
+        )
+
+        # Shared across clients: provider limits are per API key, not per object
+        self.limiter = limiter or get_rate_limiter()
+        self.concurrency = concurrency or get_concurrency()
+        self.breaker = breaker or get_circuit_breaker()
+        self.retry_budget = retry_budget or get_retry_budget()
     
     def chat(self, system_prompt: str, user_prompt: str, max_tokens: int = 500) -> str:
         """
@@ -40,54 +99,116 @@ class OpenRouterClient:
         # If no API key, return fallback response
         if not self.api_key or self.api_key == "":
             logger.warning("No API key, returning fallback response")
+            OPENROUTER_SHORT_CIRCUITS.inc(reason="no_api_key")
+            return self._fallback_response(user_prompt)
+
+        # Provider is failing: don't spend a timeout finding out again
+        if not self.breaker.allow():
+            logger.warning("Circuit open, returning fallback response")
+            OPENROUTER_SHORT_CIRCUITS.inc(reason="circuit_open")
             return self._fallback_response(user_prompt)
         
-        try:
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-            
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": max_tokens,
-                "temperature": 0.3,
-                "response_format": {"type": "json_object"}  # Force JSON response
-            }
-            
-            logger.info(f"Sending request to OpenRouter (model: {self.model})")
-            
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers=self.headers,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                logger.info("OpenRouter response received")
-                return content
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"}  # Force JSON response
+        }
+
+        # Budget the prompt plus the completion we allow against tokens/min
+        tokens = estimate_tokens(system_prompt + user_prompt) + max_tokens
+        self.retry_budget.deposit()
+        
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            started = latency = None
+            try:
+                self.limiter.acquire(tokens)
+
+                logger.info(f"Sending request to OpenRouter (model: {self.model})")
+
+                with self.concurrency.slot():
+                    started = time.monotonic()
+                    response = self.session.post(
+                        self.base_url,
+                        json=payload,
+                        timeout=self.timeout
+                    )
+                    latency = time.monotonic() - started
+
+                OPENROUTER_REQUEST_SECONDS.observe(latency, status=response.status_code)
+
+                if response.status_code == 429:
+                    if attempt == RATE_LIMIT_RETRIES or not self.retry_budget.withdraw():
+                        break
+
+                    wait = parse_retry_after(response.headers.get("Retry-After"))
+                    wait = wait if wait is not None else 2 ** attempt
+                    logger.warning(f"OpenRouter rate limited, retrying in {wait:.1f}s")
+                    self.limiter.pause(wait)
+                    self.concurrency.on_error()
+                    continue
+
+                if response.status_code >= 500:
+                    self.concurrency.on_error()
+                    self.breaker.record_failure()
+                else:
+                    self.concurrency.on_success(latency)
+                    self.breaker.record_success()
                 
-            elif response.status_code == 401:
-                error_data = response.json()
-                logger.error(f"Authentication failed: {error_data}")
-                logger.error("Please check your OPENROUTER_API_KEY in .env file")
+                if response.status_code == 200:
+                    result = response.json()
+                    content = result['choices'][0]['message']['content']
+                    logger.info("OpenRouter response received")
+                    return content
+                    
+                elif response.status_code == 401:
+                    error_data = response.json()
+                    logger.error(f"Authentication failed: {error_data}")
+                    logger.error("Please check your OPENROUTER_API_KEY in .env file")
+                    return self._fallback_response(user_prompt)
+                    
+                else:
+                    logger.error(f"OpenRouter error {response.status_code}: {response.text}")
+                    return self._fallback_response(user_prompt)
+                    
+            except requests.exceptions.Timeout:
+                logger.error("Request timeout")
+                OPENROUTER_REQUEST_SECONDS.observe(time.monotonic() - started, status="timeout")
+                self.concurrency.on_error()
+                self.breaker.record_failure()
                 return self._fallback_response(user_prompt)
                 
-            else:
-                logger.error(f"OpenRouter error {response.status_code}: {response.text}")
+            except Exception as e:
+                logger.error(f"Error in chat request: {str(e)}")
+                # The request itself raised (connection refused, reset, ...)
+                if started is not None and latency is None:
+                    OPENROUTER_REQUEST_SECONDS.observe(time.monotonic() - started, status="error")
+                self.breaker.record_failure()
                 return self._fallback_response(user_prompt)
-                
-        except requests.exceptions.Timeout:
-            logger.error("Request timeout")
-            return self._fallback_response(user_prompt)
-            
-        except Exception as e:
-            logger.error(f"Error in chat request: {str(e)}")
-            return self._fallback_response(user_prompt)
+
+        logger.error("OpenRouter still rate limiting after retries, using fallback")
+        self.breaker.record_failure()
+        return self._fallback_response(user_prompt)
+    
+    async def achat(self, system_prompt: str, user_prompt: str, max_tokens: int = 500) -> str:
+        """
+        Async chat completion. Same contract as chat(); many calls can be
+        awaited together and at most max_concurrency run at once.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.chat, system_prompt, user_prompt, max_tokens
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
     
     def _fallback_response(self, user_prompt: str) -> str:
         """Generate fallback response when API fails"""
@@ -110,10 +231,19 @@ class OpenRouterClient:
                 "Key point 2 from article", 
                 "Key point 3 from article"
             ],
-            "topic": "general"
+            "topic": "general",
+            "fallback": True
         }
         
         return json.dumps(fallback_json)
+
+    @staticmethod
+    def is_fallback(response: str) -> bool:
+        """True if response came from _fallback_response, not the model"""
+        try:
+            return json.loads(response).get("fallback") is True
+        except Exception:
+            return False
     
     def summarize(self, text: str) -> str:
         """Simple summarization method (alternative to chat)"""
@@ -1,27 +1,262 @@
 from app.ai.openrouter_client import OpenRouterClient
+from app.ai.cache import SummaryCache, get_summary_cache
+from app.ai.circuit import CLOSED, CircuitOpenError, backoff_delay, get_retry_budget
 from app.config.logging import logger
+from app.config.metrics import SUMMARIES
+from app.config.settings import (
+    SUMMARY_BATCH_TOKEN_BUDGET,
+    SUMMARY_BATCH_MAX_ITEMS,
+    RETRY_ATTEMPTS,
+)
+from app.ingestion.normalize import estimate_tokens
+from app.utils.topics import CANONICAL_TOPICS
+import asyncio
 import json
 import re
 import time
-from typing import List
+from typing import List, Optional
+
+# Bump whenever the article prompt changes so cached summaries are not reused
+PROMPT_VERSION = "article-v1"
+
+# The topic words the prompts offer, plus the canonical topics themselves
+KNOWN_TOPICS = frozenset(
+    ("ai", "llm", "mlops", "startup", "cloud", "security", "devtools", "web", "mobile", "data")
+) | frozenset(CANONICAL_TOPICS)
 
 
 class Processor:
     """
     Responsible ONLY for AI work.
-    - Per-article summarization
+    - Per-article summarization (sync, or concurrent via the async client)
+    - Summary cache lookups, so repeated content never hits the network
+    - Retries with jittered backoff, within the shared retry budget and
+      only while the client's circuit breaker is closed; an open circuit
+      raises CircuitOpenError instead of producing a fallback summary
     - Digest overview generation
     """
 
-    def __init__(self):
-        self.client = OpenRouterClient()
-        self.retry_count = 3
-        self.retry_delay = 2
+    def __init__(self, client: OpenRouterClient = None, cache: SummaryCache = None):
+        self.client = client or OpenRouterClient()
+        self.cache = cache or get_summary_cache()
+        self.retry_count = RETRY_ATTEMPTS
+        self.retry_budget = get_retry_budget()
 
     # --------------------------------------------------
     # ARTICLE LEVEL SUMMARIZATION (RUN ONCE PER ARTICLE)
     # --------------------------------------------------
     def summarize_article(self, raw_text: str) -> dict:
+        system_prompt, user_prompt, limited_text = self._article_prompts(raw_text)
+
+        cache_key = self._cache_key(limited_text)
+        cached = self.cache.get(cache_key)
+        if cached:
+            SUMMARIES.inc(result="cache")
+            return cached
+
+        # 🔥 MINIMAL FIX: OpenRouter disabled → direct fallback
+        if not getattr(self.client, "api_key", None):
+            logger.info("⚠️ OpenRouter disabled. Using fallback summary.")
+            return self._fallback_summary(limited_text, failed=False)
+
+        for attempt in range(self.retry_count):
+            try:
+                logger.info(f"Summarizing article (attempt {attempt + 1}/{self.retry_count})")
+
+                response = self.client.chat(system_prompt, user_prompt)
+
+                parsed = self._accept(response)
+                if parsed:
+                    self._remember(cache_key, response, parsed)
+                    SUMMARIES.inc(result="model")
+                    return parsed
+
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+
+            delay = self._retry_delay(attempt)
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        logger.error("All summarization attempts failed, using fallback")
+        return self._fallback_summary(limited_text)
+
+    # --------------------------------------------------
+    # ASYNC / CONCURRENT SUMMARIZATION
+    # --------------------------------------------------
+    async def asummarize_article(self, raw_text: str, check_cache: bool = True) -> dict:
+        """Async twin of summarize_article() on top of client.achat()."""
+        system_prompt, user_prompt, limited_text = self._article_prompts(raw_text)
+
+        cache_key = self._cache_key(limited_text)
+        cached = self.cache.get(cache_key) if check_cache else None
+        if cached:
+            SUMMARIES.inc(result="cache")
+            return cached
+
+        if not getattr(self.client, "api_key", None):
+            return self._fallback_summary(limited_text, failed=False)
+
+        for attempt in range(self.retry_count):
+            try:
+                logger.info(f"Summarizing article (attempt {attempt + 1}/{self.retry_count})")
+
+                response = await self.client.achat(system_prompt, user_prompt)
+
+                parsed = self._accept(response)
+                if parsed:
+                    self._remember(cache_key, response, parsed)
+                    SUMMARIES.inc(result="model")
+                    return parsed
+
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+
+            delay = self._retry_delay(attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        logger.error("All summarization attempts failed, using fallback")
+        return self._fallback_summary(limited_text)
+
+    def summarize_articles(self, texts: List[str], check_cache: bool = True) -> list:
+        """
+        Summarize many articles concurrently (capped by the client's
+        max_concurrency). Results are in input order; an article that
+        raised gets its exception in place of a dict. check_cache=False
+        skips the lookup for callers that already missed it.
+        """
+        async def run():
+            return await asyncio.gather(
+                *(self.asummarize_article(text, check_cache) for text in texts),
+                return_exceptions=True,
+            )
+
+        return asyncio.run(run())
+
+    # --------------------------------------------------
+    # BATCHED SUMMARIZATION (MANY ARTICLES PER REQUEST)
+    # --------------------------------------------------
+    def summarize_batch(self, texts: List[str]) -> list:
+        """
+        Summarize many articles with few requests. Cache hits are served
+        locally; the rest are packed into multi-article prompts within
+        the token budget and the packs are sent concurrently. Articles a
+        pack returns no valid result for fall back to single calls.
+        Results are in input order, like summarize_articles().
+        """
+        results = [None] * len(texts)
+        pending = []
+
+        for i, text in enumerate(texts):
+            limited_text = self._article_prompts(text)[2]
+            cache_key = self._cache_key(limited_text)
+
+            cached = self.cache.get(cache_key)
+            if cached:
+                SUMMARIES.inc(result="cache")
+                results[i] = cached
+            else:
+                pending.append((i, limited_text, cache_key))
+
+        if pending and getattr(self.client, "api_key", None):
+            async def run():
+                return await asyncio.gather(
+                    *(self._asummarize_pack(pack) for pack in self._pack(pending)),
+                    return_exceptions=True,
+                )
+
+            for outcome in asyncio.run(run()):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Batch summarization request failed: {outcome}")
+                    continue
+
+                for i, parsed in outcome.items():
+                    results[i] = parsed
+
+        leftovers = [i for i, result in enumerate(results) if result is None]
+        if leftovers:
+            logger.info(f"Summarizing {len(leftovers)} articles individually")
+            # Already looked up (and counted as misses) above
+            singles = self.summarize_articles([texts[i] for i in leftovers], check_cache=False)
+            for i, result in zip(leftovers, singles):
+                results[i] = result
+
+        return results
+
+    def _pack(self, pending: list) -> list:
+        """Greedy packing by estimated tokens."""
+        packs, current, used = [], [], 0
+
+        for item in pending:
+            cost = estimate_tokens(item[1]) + 50
+
+            if current and (
+                used + cost > SUMMARY_BATCH_TOKEN_BUDGET
+                or len(current) >= SUMMARY_BATCH_MAX_ITEMS
+            ):
+                packs.append(current)
+                current, used = [], 0
+
+            current.append(item)
+            used += cost
+
+        if current:
+            packs.append(current)
+
+        return packs
+
+    async def _asummarize_pack(self, pack: list) -> dict:
+        system_prompt = (
+            "You are a senior technology newsletter editor. "
+            "You write extremely concise summaries for email digests. "
+            "ALWAYS return a valid JSON object of the form "
+            '{"items": [...]} with one entry per article, each with exactly '
+            "these keys: id, summary, takeaways, topic."
+        )
+
+        articles = "\n\n".join(
+            f"[{n}]\n{limited_text}" for n, (_, limited_text, _) in enumerate(pack, start=1)
+        )
+
+        user_prompt = f"""
+ARTICLES:
+{articles}
+
+TASK:
+Return STRICT JSON {{"items": [...]}} with one item per article:
+- id: the article number in brackets
+- summary: ONE or TWO sentences, max 40 words total
+- takeaways: list of EXACTLY 3 very short bullet points (5–7 words each)
+- topic: ONE lowercase word (ai, llm, mlops, startup, cloud, security, devtools, web, mobile, data)
+"""
+
+        logger.info(f"Summarizing {len(pack)} articles in one request")
+
+        response = await self.client.achat(
+            system_prompt, user_prompt, max_tokens=150 * len(pack)
+        )
+
+        if not response or OpenRouterClient.is_fallback(response):
+            return {}
+
+        by_id = self._safe_parse_batch(response)
+        summarized = {}
+
+        # The per-article instructions match the single prompt, so results
+        # share the PROMPT_VERSION cache key with summarize_article()
+        for n, (i, _, cache_key) in enumerate(pack, start=1):
+            parsed = by_id.get(n)
+            if parsed:
+                self._remember(cache_key, response, parsed)
+                SUMMARIES.inc(result="model")
+                summarized[i] = parsed
+
+        return summarized
+
+    def _article_prompts(self, raw_text: str) -> tuple[str, str, str]:
         system_prompt = (
             "You are a senior technology newsletter editor. "
             "You write extremely concise summaries for email digests. "
@@ -30,11 +265,6 @@ class Processor:
 
         limited_text = raw_text[:3000] + "..." if len(raw_text) > 3000 else raw_text
 
-        # 🔥 MINIMAL FIX: OpenRouter disabled → direct fallback
-        if not getattr(self.client, "api_key", None):
-            logger.info("⚠️ OpenRouter disabled. Using fallback summary.")
-            return self._create_fallback_summary(limited_text)
-
         user_prompt = f"""
 ARTICLE CONTENT:
 {limited_text}
@@ -46,28 +276,62 @@ Return STRICT JSON with:
 - topic: ONE lowercase word (ai, llm, mlops, startup, cloud, security, devtools, web, mobile, data)
 """
 
-        for attempt in range(self.retry_count):
-            try:
-                logger.info(f"Summarizing article (attempt {attempt + 1}/{self.retry_count})")
+        return system_prompt, user_prompt, limited_text
 
-                response = self.client.chat(system_prompt, user_prompt)
+    def _cache_key(self, limited_text: str) -> str:
+        return SummaryCache.make_key(
+            limited_text, PROMPT_VERSION, getattr(self.client, "model", None)
+        )
+
+    def _remember(self, cache_key: str, response: str, parsed: dict):
+        # Never cache the client's offline fallback as if the model wrote it
+        if OpenRouterClient.is_fallback(response):
+            return
 
-                if not response:
-                    raise ValueError("Empty response from AI")
+        try:
+            self.cache.put(cache_key, parsed)
+        except Exception as e:
+            logger.warning(f"Could not cache summary: {e}")
 
-                parsed = self._safe_parse(response)
+    def _retry_delay(self, attempt: int) -> Optional[float]:
+        """
+        Backoff before the next attempt, or None to give up now (fallback).
+        Raises CircuitOpenError if the circuit is open or probing: the
+        client would only return its fallback, and the caller should
+        leave the article for later rather than store a placeholder.
+        """
+        breaker = getattr(self.client, "breaker", None)
+        if breaker is not None and breaker.state != CLOSED:
+            raise CircuitOpenError("AI provider circuit is open")
 
-                if parsed["summary"] and len(parsed["takeaways"]) == 3:
-                    logger.info("Article summarized successfully")
-                    return parsed
+        if attempt >= self.retry_count - 1:
+            return None
 
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < self.retry_count - 1:
-                    time.sleep(self.retry_delay)
+        if not self.retry_budget.withdraw():
+            logger.warning("Retry budget exhausted, not retrying")
+            return None
 
-        logger.error("All summarization attempts failed, using fallback")
-        return self._create_fallback_summary(limited_text)
+        return backoff_delay(attempt)
+
+    def _accept(self, response: str):
+        if not response:
+            raise ValueError("Empty response from AI")
+
+        # The client gave up (timeout, 5xx, open circuit): a failed attempt
+        if OpenRouterClient.is_fallback(response):
+            raise RuntimeError("AI provider unavailable")
+
+        # Not a summary (refusal, prose, truncated JSON): a failed attempt,
+        # retried or answered with the fallback, and never cached
+        parsed = self._safe_parse(response)
+        if parsed is None:
+            raise ValueError(f"Unparseable AI response: {response[:80]!r}")
+
+        if len(parsed["takeaways"]) == 3:
+            logger.info("Article summarized successfully")
+            return parsed
+
+        return None
 
     # --------------------------------------------------
     # BACKWARD COMPATIBILITY (CRITICAL)
@@ -105,6 +369,12 @@ Start with: "Good morning! Today's digest features..."
                 prompt,
                 max_tokens=150,
             )
+
+            # Open circuit / timeout: the client's fallback JSON is not an overview
+            if not overview or OpenRouterClient.is_fallback(overview):
+                logger.warning("AI provider unavailable, using canned overview")
+                return f"Good morning! Today's digest features {len(articles)} curated articles."
+
             return overview.strip()
 
         except Exception as e:
@@ -114,7 +384,8 @@ Start with: "Good morning! Today's digest features..."
     # --------------------------------------------------
     # SAFE JSON PARSER
     # --------------------------------------------------
-    def _safe_parse(self, text: str) -> dict:
+    def _safe_parse(self, text: str) -> Optional[dict]:
+        """The model's JSON summary, or None if the reply is not one."""
         cleaned = re.sub(r"```json|```|\n", "", text).strip()
         match = re.search(r"\{.*\}", cleaned, re.DOTALL)
         if match:
@@ -122,26 +393,106 @@ Start with: "Good morning! Today's digest features..."
 
         try:
             data = json.loads(cleaned)
+        except Exception:
+            return None
 
-            takeaways = data.get("takeaways", [])
-            if not isinstance(takeaways, list):
-                takeaways = []
+        if not isinstance(data, dict):
+            return None
 
-            while len(takeaways) < 3:
-                takeaways.append("Important insight from the article")
+        summary = str(data.get("summary") or "").strip()
+        if not summary:
+            return None
 
-            return {
-                "summary": data.get("summary", "Key insights from today's article."),
-                "takeaways": takeaways[:3],
-                "topic": str(data.get("topic", "general")).lower(),
-            }
+        takeaways = data.get("takeaways", [])
+        if not isinstance(takeaways, list):
+            takeaways = []
+
+        while len(takeaways) < 3:
+            takeaways.append("Important insight from the article")
 
+        return {
+            "summary": summary,
+            "takeaways": takeaways[:3],
+            "topic": str(data.get("topic", "general")).lower(),
+        }
+
+    # --------------------------------------------------
+    # SAFE JSON PARSER (BATCH)
+    # --------------------------------------------------
+    def _safe_parse_batch(self, text: str) -> dict:
+        """
+        Parse {"items": [...]} (or a bare list) into {id: parsed item}.
+        Items are taken as is or not at all: one without an integer id, a
+        summary, exactly 3 non-empty takeaways and a known topic is dropped
+        (never padded, so never cached) and the caller retries it alone.
+        """
+        cleaned = re.sub(r"```json|```", "", text).strip()
+        match = re.search(r"[\[{].*[\]}]", cleaned, re.DOTALL)
+        if match:
+            cleaned = match.group(0)
+
+        try:
+            data = json.loads(cleaned)
         except Exception:
-            return self._create_fallback_summary(text)
+            return {}
+
+        items = data.get("items", []) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return {}
+
+        parsed = {}
+
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+
+            try:
+                item_id = int(item.get("id"))
+            except (TypeError, ValueError):
+                continue
+
+            summary = str(item.get("summary") or "").strip()
+            takeaways = item.get("takeaways")
+            topic = str(item.get("topic") or "").strip().lower()
+
+            if not summary or topic not in KNOWN_TOPICS:
+                continue
+            if not isinstance(takeaways, list) or len(takeaways) != 3:
+                continue
+
+            takeaways = [str(t).strip() if isinstance(t, str) else "" for t in takeaways]
+            if not all(takeaways):
+                continue
+
+            parsed[item_id] = {
+                "summary": summary,
+                "takeaways": takeaways,
+                "topic": topic,
+            }
+
+        return parsed
 
     # --------------------------------------------------
     # FALLBACK SUMMARY
     # --------------------------------------------------
+    def _fallback_summary(self, limited_text: str, failed: bool = True) -> dict:
+        """
+        Fallback in place of a model summary, counted for the fallback rate.
+        `failed` (every case but OpenRouter being disabled) flags it for
+        is_fallback(), so callers can retry the article later.
+        """
+        SUMMARIES.inc(result="fallback")
+
+        summary = self._create_fallback_summary(limited_text)
+        if failed:
+            summary["fallback"] = True
+        return summary
+
+    @staticmethod
+    def is_fallback(result) -> bool:
+        """True if a summarize result is a placeholder after the model failed."""
+        return isinstance(result, dict) and result.get("fallback") is True
+
     def _create_fallback_summary(self, text: str) -> dict:
         first_sentence = re.split(r"[.!?]", text)[0][:150]
 
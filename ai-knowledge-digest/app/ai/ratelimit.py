@@ -0,0 +1,184 @@
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from app.config.settings import (
+    OPENROUTER_MAX_CONCURRENCY,
+    OPENROUTER_REQUESTS_PER_MINUTE,
+    OPENROUTER_TOKENS_PER_MINUTE,
+    OPENROUTER_LATENCY_TARGET_SECONDS,
+)
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter with two buckets refilled continuously:
+    requests per minute and (estimated) tokens per minute.
+    pause() blocks every caller until a provider Retry-After expires.
+    A limit of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens: int = 0):
+        """Block until one request carrying `tokens` tokens may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                # A single call bigger than the whole bucket waits for a full one
+                tokens_needed = min(tokens, self.tpm)
+                wait = self._paused_until - now
+
+                if wait <= 0:
+                    waits = [0.0]
+                    if self.rpm and self._requests < 1:
+                        waits.append((1 - self._requests) * 60 / self.rpm)
+                    if self.tpm and self._tokens < tokens_needed:
+                        waits.append((tokens_needed - self._tokens) * 60 / self.tpm)
+                    wait = max(waits)
+
+                if wait <= 0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= tokens_needed
+                    return
+
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on in-flight calls: the limit grows by ~1 per round of
+    healthy calls (latency under target) and halves on errors, 429s
+    or slow responses, between `minimum` and `maximum`.
+    """
+
+    def __init__(self, maximum: int, latency_target: float, minimum: int = 1, initial: Optional[int] = None):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.limit = float(initial or max(minimum, maximum // 2))
+
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+
+    def on_success(self, latency: float):
+        with self._cond:
+            if latency <= self.latency_target:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            else:
+                self.limit = max(self.minimum, self.limit * 0.5)
+            self._cond.notify_all()
+
+    def on_error(self):
+        with self._cond:
+            self.limit = max(self.minimum, self.limit * 0.5)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After as seconds; accepts delta-seconds or an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
+
+
+_limiter = None
+_concurrency = None
+_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    global _limiter
+
+    with _lock:
+        if _limiter is None:
+            _limiter = TokenBucket(
+                OPENROUTER_REQUESTS_PER_MINUTE, OPENROUTER_TOKENS_PER_MINUTE
+            )
+
+    return _limiter
+
+
+def get_concurrency() -> AdaptiveConcurrency:
+    global _concurrency
+
+    with _lock:
+        if _concurrency is None:
+            _concurrency = AdaptiveConcurrency(
+                maximum=OPENROUTER_MAX_CONCURRENCY,
+                latency_target=OPENROUTER_LATENCY_TARGET_SECONDS,
+            )
+
+    return _concurrency
+
+
+def _share(limit: int, shares: int) -> int:
+    return max(1, limit // shares) if limit else 0
+
+
+def share_limits(shares: int):
+    """
+    Give this process 1/shares of the OpenRouter limits. Every process
+    has its own limiter, so `shares` worker processes calling this keep
+    their sum within the configured requests/tokens per minute and
+    concurrency. Call before the first OpenRouterClient is built.
+    """
+    global _limiter, _concurrency
+
+    with _lock:
+        _limiter = TokenBucket(
+            _share(OPENROUTER_REQUESTS_PER_MINUTE, shares),
+            _share(OPENROUTER_TOKENS_PER_MINUTE, shares),
+        )
+        _concurrency = AdaptiveConcurrency(
+            maximum=_share(OPENROUTER_MAX_CONCURRENCY, shares) or 1,
+            latency_target=OPENROUTER_LATENCY_TARGET_SECONDS,
+        )
@@ -0,0 +1,308 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.config.logging import logger
+from app.utils.files import atomic_write_text
+
+# Seconds; covers a cached feed (~ms) up to a slow LLM call or SMTP retry
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+# --------------------------------------------------
+# Metric types
+# --------------------------------------------------
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self):
+        """(suffix, label string, value) lines for the exposition."""
+
+    def expose(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(
+            f"{self.name}{suffix}{labels} {_format_value(value)}"
+            for suffix, labels, value in self.samples()
+        )
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [("", _format_labels(self.labelnames, key), value) for key, value in items]
+
+    def _merge(self, key, value):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    @contextmanager
+    def time(self, **labels):
+        """Set the gauge to the duration of the block (last run wins)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.set(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [("", _format_labels(self.labelnames, key), value) for key, value in items]
+
+    def _merge(self, key, value):
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # per-bucket (non-cumulative) counts incl. +Inf, sum, count
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(key, (list(s[0]), s[1], s[2])) for key, s in self._values.items()]
+
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(("_bucket", _format_labels(self.labelnames, key, le), cumulative))
+            lines.append(("_sum", _format_labels(self.labelnames, key), total))
+            lines.append(("_count", _format_labels(self.labelnames, key), count))
+        return lines
+
+    def _merge(self, key, value):
+        counts, total, count = value
+        with self._lock:
+            state = self._values.setdefault(key, [[0] * (len(self.buckets) + 1), 0.0, 0])
+            state[0] = [a + b for a, b in zip(state[0], counts)]
+            state[1] += total
+            state[2] += count
+
+
+# --------------------------------------------------
+# Registry + exposition
+# --------------------------------------------------
+class Registry:
+    """
+    Process-wide metrics in the Prometheus text format, served on a
+    local HTTP endpoint and/or written as a node_exporter textfile.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels=()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels=()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def expose(self) -> str:
+        return "\n".join(metric.expose() for metric in self._metrics.values()) + "\n"
+
+    # Child processes (sharded generation) have their own registry:
+    # they return a snapshot and the parent merges it
+    def snapshot(self) -> dict:
+        snapshot = {}
+        for name, metric in self._metrics.items():
+            with metric._lock:
+                snapshot[name] = {
+                    key: (list(v[0]), v[1], v[2]) if isinstance(metric, Histogram) else v
+                    for key, v in metric._values.items()
+                }
+        return snapshot
+
+    def merge(self, snapshot: dict):
+        for name, values in snapshot.items():
+            metric = self._metrics.get(name)
+            if metric is None:
+                continue
+            for key, value in values.items():
+                metric._merge(key, value)
+
+    def write_textfile(self, path: str):
+        """Atomic, so the collector never reads a partial file."""
+        atomic_write_text(path, self.expose())
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve GET /metrics from a daemon thread."""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+
+                body = registry.expose().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True, name="metrics").start()
+
+        logger.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+        return server
+
+
+registry = Registry()
+
+
+# --------------------------------------------------
+# Pipeline metrics
+# --------------------------------------------------
+STAGE_SECONDS = registry.gauge(
+    "digest_stage_seconds", "Duration of the last run of each daily job stage", ["stage"]
+)
+LAST_SUCCESS = registry.gauge(
+    "digest_daily_job_last_success_timestamp_seconds", "Unix time the daily job last completed"
+)
+
+# Ingestion
+FEED_FETCH_SECONDS = registry.histogram(
+    "digest_feed_fetch_seconds", "Feed download and parse time", ["feed", "status"]
+)
+FEED_ENTRIES = registry.gauge(
+    "digest_feed_entries", "Entries in the last fetch of each feed", ["feed"]
+)
+SAVE_ARTICLES_SECONDS = registry.histogram(
+    "digest_save_articles_seconds", "save_articles call time", ["source"]
+)
+SAVE_ARTICLES_ROWS_PER_SECOND = registry.gauge(
+    "digest_save_articles_rows_per_second", "Rows inserted per second by the last save_articles", ["source"]
+)
+ARTICLES_SAVED = registry.counter(
+    "digest_articles_saved_total", "Articles inserted", ["source"]
+)
+ARTICLES_KNOWN = registry.counter(
+    "digest_articles_known_total", "Scraped articles dropped as already stored", ["source"]
+)
+ARTICLES_NEAR_DUPLICATE = registry.counter(
+    "digest_articles_near_duplicate_total", "Articles saved as near-duplicates (not enriched)", ["source"]
+)
+
+# AI
+OPENROUTER_REQUEST_SECONDS = registry.histogram(
+    "digest_openrouter_request_seconds", "OpenRouter HTTP request latency", ["status"]
+)
+OPENROUTER_SHORT_CIRCUITS = registry.counter(
+    "digest_openrouter_short_circuits_total", "Calls answered with the fallback without a request", ["reason"]
+)
+SUMMARIES = registry.counter(
+    "digest_summaries_total", "Article summaries by where they came from", ["result"]
+)
+ENRICHMENT_QUEUE_DEPTH = registry.gauge(
+    "digest_enrichment_queue_depth", "Articles by enrichment status", ["status"]
+)
+
+# Generation
+USER_GENERATION_SECONDS = registry.histogram(
+    "digest_user_generation_seconds", "Time to build one user's digest"
+)
+DIGESTS_GENERATED = registry.counter(
+    "digest_digests_generated_total", "Digests generated"
+)
+
+# Email
+SMTP_SEND_SECONDS = registry.histogram(
+    "digest_smtp_send_seconds", "SMTP send time per email", ["status"]
+)
+OUTBOX_DEPTH = registry.gauge(
+    "digest_email_outbox_depth", "Outbox rows by status", ["status"]
+)
@@ -16,6 +16,14 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL")
 OPENROUTER_API_BASE = "https://openrouter.ai/api/v1/chat/completions"
 OPENROUTER_API_URL = OPENROUTER_API_BASE  
+OPENROUTER_MAX_CONCURRENCY = int(os.getenv("OPENROUTER_MAX_CONCURRENCY", 8))
+OPENROUTER_REQUESTS_PER_MINUTE = int(os.getenv("OPENROUTER_REQUESTS_PER_MINUTE", 120))  # 0 = unlimited
+OPENROUTER_TOKENS_PER_MINUTE = int(os.getenv("OPENROUTER_TOKENS_PER_MINUTE", 200000))  # 0 = unlimited
+OPENROUTER_LATENCY_TARGET_SECONDS = float(os.getenv("OPENROUTER_LATENCY_TARGET_SECONDS", 10))
+AI_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", 5))  # consecutive failures
+AI_CIRCUIT_RESET_SECONDS = float(os.getenv("AI_CIRCUIT_RESET_SECONDS", 30))
+AI_RETRY_BUDGET_RATIO = float(os.getenv("AI_RETRY_BUDGET_RATIO", 0.2))  # retries per request
+AI_RETRY_BUDGET_RESERVE = int(os.getenv("AI_RETRY_BUDGET_RESERVE", 10))
 
 # ------------------------
 # Email Configuration
@@ -24,7 +32,16 @@ SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
 SMTP_USER = os.getenv("SMTP_USER")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
-FROM_EMAIL = SMTP_USER
+FROM_EMAIL = os.getenv("FROM_EMAIL") or SMTP_USER
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() == "true"  # STARTTLS; login only if SMTP_USER set
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", 4))
+SMTP_MAX_MESSAGES_PER_CONNECTION = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", 100))
+EMAIL_DISPATCH_WORKERS = int(os.getenv("EMAIL_DISPATCH_WORKERS", 8))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", 5))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", 30))  # doubles per attempt
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", 3600))
+EMAIL_DISPATCH_LINGER_SECONDS = float(os.getenv("EMAIL_DISPATCH_LINGER_SECONDS", 600))  # wait for retries due this soon
+EMAIL_FRAGMENT_CACHE_SIZE = int(os.getenv("EMAIL_FRAGMENT_CACHE_SIZE", 10000))  # rendered article fragments kept
 
 # ------------------------
 # Application Settings
@@ -33,10 +50,55 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 DIGEST_GENERATION_TIME = os.getenv("DIGEST_GENERATION_TIME", "09:00")
 MAX_ARTICLES_PER_DIGEST = int(os.getenv("MAX_ARTICLES_PER_DIGEST", 5))
 ARTICLE_AGE_LIMIT_DAYS = int(os.getenv("ARTICLE_AGE_LIMIT_DAYS", 7))
+GENERATOR_WORKERS = int(os.getenv("GENERATOR_WORKERS", 1))  # >1: sharded multi-process generation
+
+# ------------------------
+# Ingestion
+# ------------------------
+FEED_FETCH_WORKERS = int(os.getenv("FEED_FETCH_WORKERS", 16))
+FEED_FETCH_PER_HOST = int(os.getenv("FEED_FETCH_PER_HOST", 4))
+FEED_CACHE_DIR = os.getenv("FEED_CACHE_DIR", ".cache/feeds")
+YOUTUBE_TRANSCRIPT_WORKERS = int(os.getenv("YOUTUBE_TRANSCRIPT_WORKERS", 4))
+TRANSCRIPT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", ".cache/transcripts")
+URL_BLOOM_PATH = os.getenv("URL_BLOOM_PATH", ".cache/seen_urls.bloom")  # delete to rebuild from articles.url
+URL_BLOOM_CAPACITY = int(os.getenv("URL_BLOOM_CAPACITY", 10_000_000))
+URL_BLOOM_ERROR_RATE = float(os.getenv("URL_BLOOM_ERROR_RATE", 0.01))
+CONTENT_TOKEN_BUDGET = int(os.getenv("CONTENT_TOKEN_BUDGET", 600))  # clean text kept per article
+NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", 0.5))  # MinHash Jaccard to join a cluster
+NEAR_DUP_WINDOW_DAYS = int(os.getenv("NEAR_DUP_WINDOW_DAYS", 3))  # recent articles checked for near-duplicates
+
+# ------------------------
+# AI Enrichment
+# ------------------------
+ENRICHMENT_WORKERS = int(os.getenv("ENRICHMENT_WORKERS", 4))
+ENRICHMENT_BATCH_SIZE = int(os.getenv("ENRICHMENT_BATCH_SIZE", 20))
+ENRICHMENT_MAX_ATTEMPTS = int(os.getenv("ENRICHMENT_MAX_ATTEMPTS", 3))
+SUMMARY_CACHE_PATH = os.getenv("SUMMARY_CACHE_PATH", ".cache/summaries.sqlite3")
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", 100000))
+SUMMARY_BATCH_TOKEN_BUDGET = int(os.getenv("SUMMARY_BATCH_TOKEN_BUDGET", 6000))
+SUMMARY_BATCH_MAX_ITEMS = int(os.getenv("SUMMARY_BATCH_MAX_ITEMS", 10))
+
+# ------------------------
+# Ranking
+# ------------------------
+RANKING_ENGINE = os.getenv("RANKING_ENGINE", "keyword")  # 'keyword' or 'bm25'
+BM25_TOP_K = int(os.getenv("BM25_TOP_K", 50))  # scores kept per user (argpartition per row); 0 opts out and keeps all
 
 # ------------------------
 # Constants
 # ------------------------
 RETRY_ATTEMPTS = 3
 RETRY_DELAY_SECONDS = 5
-REQUEST_TIMEOUT = 30
\ No newline at end of file
+REQUEST_TIMEOUT = 30
+
+# ------------------------
+# Maintenance
+# ------------------------
+MAINTENANCE_CHUNK_SIZE = int(os.getenv("MAINTENANCE_CHUNK_SIZE", 5000))  # rows per keyset chunk / commit
+MAINTENANCE_CHECKPOINT_DIR = os.getenv("MAINTENANCE_CHECKPOINT_DIR", ".cache/maintenance")
+
+# ------------------------
+# Metrics
+# ------------------------
+METRICS_PORT = int(os.getenv("METRICS_PORT", 0))  # serve /metrics on localhost, 0 = disabled
+METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE", "")  # node_exporter textfile path, "" = disabled
\ No newline at end of file
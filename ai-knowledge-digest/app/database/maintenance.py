@@ -0,0 +1,187 @@
+import argparse
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from sqlalchemy import select, update
+
+from app.config.logging import logger
+from app.config.settings import MAINTENANCE_CHUNK_SIZE, MAINTENANCE_CHECKPOINT_DIR
+from app.database.db import SessionLocal
+from app.utils.files import atomic_write_text
+
+
+class Checkpoint:
+    """
+    Last committed key of a job, one JSON file per job name.
+    Written atomically, so a kill mid-write leaves the previous
+    checkpoint intact.
+    """
+
+    def __init__(self, name: str, directory: str = MAINTENANCE_CHECKPOINT_DIR):
+        self.directory = directory
+        self.path = os.path.join(directory, f"{name}.json")
+
+    def load(self) -> Optional[dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: dict):
+        atomic_write_text(self.path, json.dumps(state))
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class ChunkedJob(ABC):
+    """
+    Base for maintenance jobs that rewrite columns of one table.
+
+    The table is walked in primary-key order, one keyset-paginated chunk
+    at a time (WHERE id > last ORDER BY id LIMIT n), each chunk streamed
+    through a server-side cursor. Only `columns` are selected, so no ORM
+    objects pile up in the session. The chunk's changes go out as one
+    bulk UPDATE, one commit per chunk, and the last committed key is then
+    checkpointed, so a killed job resumes where it stopped and memory
+    stays bounded by the chunk size whatever the table size. A chunk can
+    be replayed if the kill lands between commit and checkpoint, so
+    transform() must be idempotent.
+
+    Subclasses set `name`, `model` and `columns` and implement transform().
+    """
+
+    name: str = None
+    model = None
+    columns: tuple = ()
+
+    def __init__(
+        self,
+        chunk_size: int = MAINTENANCE_CHUNK_SIZE,
+        dry_run: bool = False,
+        restart: bool = False,
+        checkpoint: Checkpoint = None,
+    ):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.restart = restart
+        self.checkpoint = checkpoint or Checkpoint(self.name)
+
+    @abstractmethod
+    def transform(self, row) -> Optional[dict]:
+        """New values for the row's columns, or None to leave it unchanged."""
+
+    def describe(self, row, values: dict) -> str:
+        """One line for a pending change, shown in dry-run mode."""
+        return f"{row.id}: {values}"
+
+    # --------------------------------------------------
+    # Run
+    # --------------------------------------------------
+    def run(self) -> dict:
+        """Process the whole table; returns scanned/updated counts."""
+        key = self.model.id
+        state = {"last_key": None, "scanned": 0, "updated": 0}
+
+        if self.restart:
+            self.checkpoint.clear()
+
+        saved = None if self.restart else self.checkpoint.load()
+        if saved:
+            state = saved
+            logger.info(
+                f"{self.name}: resuming after {state['last_key']} "
+                f"({state['scanned']} scanned, {state['updated']} updated)"
+            )
+
+        last_key = (
+            key.type.python_type(state["last_key"])
+            if state["last_key"] is not None
+            else None
+        )
+        start = time.perf_counter()
+        db = SessionLocal()
+
+        try:
+            while True:
+                scanned, last_key, changes = self._scan_chunk(db, key, last_key)
+                if not scanned:
+                    break
+
+                if changes and not self.dry_run:
+                    db.execute(update(self.model), changes)
+
+                state["last_key"] = str(last_key)
+                state["scanned"] += scanned
+                state["updated"] += len(changes)
+
+                if self.dry_run:
+                    db.rollback()
+                else:
+                    db.commit()
+                    self.checkpoint.save(state)
+
+                logger.info(
+                    f"{self.name}: {state['scanned']} scanned, "
+                    f"{state['updated']} {'would update' if self.dry_run else 'updated'}"
+                )
+
+        except Exception:
+            db.rollback()
+            raise
+
+        finally:
+            db.close()
+
+        if not self.dry_run:
+            self.checkpoint.clear()
+
+        logger.info(
+            f"{self.name}: done in {time.perf_counter() - start:.1f} s - "
+            f"{state['scanned']} scanned, "
+            f"{state['updated']} {'would be updated (dry run)' if self.dry_run else 'updated'}"
+        )
+        return {"scanned": state["scanned"], "updated": state["updated"]}
+
+    def _scan_chunk(self, db, key, last_key) -> tuple[int, object, list[dict]]:
+        """Scan one chunk after `last_key`: (rows scanned, new last key, changes)."""
+        stmt = select(key, *self.columns).order_by(key).limit(self.chunk_size)
+        if last_key is not None:
+            stmt = stmt.where(key > last_key)
+
+        scanned = 0
+        changes = []
+
+        result = db.execute(stmt.execution_options(yield_per=self.chunk_size))
+        for row in result:
+            scanned += 1
+            last_key = row.id
+
+            values = self.transform(row)
+            if not values:
+                continue
+
+            changes.append({"id": row.id, **values})
+            if self.dry_run:
+                logger.info(f"{self.name} [dry run] {self.describe(row, values)}")
+
+        return scanned, last_key, changes
+
+
+def run_from_cli(job_cls: type[ChunkedJob]) -> dict:
+    """Parse the common maintenance flags and run `job_cls`."""
+    parser = argparse.ArgumentParser(description=job_cls.__doc__)
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    parser.add_argument("--chunk-size", type=int, default=MAINTENANCE_CHUNK_SIZE)
+    parser.add_argument("--restart", action="store_true", help="ignore any saved checkpoint")
+    args = parser.parse_args()
+
+    job = job_cls(chunk_size=args.chunk_size, dry_run=args.dry_run, restart=args.restart)
+    return job.run()
@@ -0,0 +1,79 @@
+"""baseline schema (users, sources, articles, digests)
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+The schema init_db() / create_all produced before migrations existed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_baseline"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "users",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("interests", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "sources",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("reliability_score", sa.Float()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+
+    op.create_table(
+        "articles",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("source_id", sa.Integer(), sa.ForeignKey("sources.id"), nullable=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("content_md", sa.Text()),
+        sa.Column("summary", sa.Text()),
+        sa.Column("takeaways", postgresql.ARRAY(sa.String())),
+        sa.Column("topic", sa.String()),
+        sa.Column("published_at", sa.DateTime()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_articles_url", "articles", ["url"], unique=True)
+    op.create_index("ix_articles_topic", "articles", ["topic"])
+    op.create_index("ix_articles_created_at", "articles", ["created_at"])
+
+    op.create_table(
+        "digests",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column("generated_date", sa.Date(), nullable=False),
+        sa.Column("overview", sa.Text()),
+        sa.Column("article_ids", postgresql.ARRAY(postgresql.UUID(as_uuid=True))),
+        sa.Column("email_sent", sa.Boolean()),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("digests")
+    op.drop_index("ix_articles_created_at", table_name="articles")
+    op.drop_index("ix_articles_topic", table_name="articles")
+    op.drop_index("ix_articles_url", table_name="articles")
+    op.drop_table("articles")
+    op.drop_table("sources")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
@@ -0,0 +1,69 @@
+"""article enrichment columns and email outbox
+
+Revision ID: 0002_enrichment_and_outbox
+Revises: 0001_baseline
+Create Date: 2026-10-18 09:05:00
+
+Adds the clean-text and enrichment-queue columns on articles and the
+email_outbox table. Articles that already exist were enriched inline
+before the queue existed, so they are backfilled as 'done'.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_enrichment_and_outbox"
+down_revision: Union[str, Sequence[str], None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("articles", sa.Column("content_text", sa.Text()))
+
+    # server_default backfills existing rows in one statement, then is dropped
+    # so new rows get the ORM default ('pending')
+    op.add_column(
+        "articles",
+        sa.Column("enrichment_status", sa.String(), nullable=False, server_default="done"),
+    )
+    op.add_column(
+        "articles",
+        sa.Column("enrichment_attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.alter_column("articles", "enrichment_status", server_default=None)
+    op.alter_column("articles", "enrichment_attempts", server_default=None)
+    op.create_index("ix_articles_enrichment_status", "articles", ["enrichment_status"])
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("digest_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("digests.id"), unique=True),
+        sa.Column("recipient", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("sent_at", sa.DateTime()),
+    )
+    op.create_index("ix_email_outbox_status", "email_outbox", ["status"])
+    op.create_index("ix_email_outbox_next_attempt_at", "email_outbox", ["next_attempt_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_email_outbox_next_attempt_at", table_name="email_outbox")
+    op.drop_index("ix_email_outbox_status", table_name="email_outbox")
+    op.drop_table("email_outbox")
+
+    op.drop_index("ix_articles_enrichment_status", table_name="articles")
+    op.drop_column("articles", "enrichment_attempts")
+    op.drop_column("articles", "enrichment_status")
+    op.drop_column("articles", "content_text")
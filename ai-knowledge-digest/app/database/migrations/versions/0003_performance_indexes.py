@@ -0,0 +1,94 @@
+"""indexes for the generator, idempotency and send queries
+
+Revision ID: 0003_performance_indexes
+Revises: 0002_enrichment_and_outbox
+Create Date: 2026-10-18 09:10:00
+
+- articles.published_at: candidate pool window (published_at >= since)
+- digests (user_id, generated_date) UNIQUE: per-user idempotency lookup,
+  and a hard guarantee against duplicate digests
+- digests (generated_date, email_sent): today's unsent digests
+- users.interests GIN: array containment (interests @> ARRAY[...])
+
+Built CONCURRENTLY so large tables stay writable during the upgrade.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_performance_indexes"
+down_revision: Union[str, Sequence[str], None] = "0002_enrichment_and_outbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Older runs could write a second digest per user and day; keep one
+    # (a sent one if any) so the unique index can be built
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, generated_date
+                ORDER BY email_sent DESC NULLS LAST, id
+            ) AS rn
+            FROM digests
+        )
+        DELETE FROM email_outbox
+        USING ranked
+        WHERE email_outbox.digest_id = ranked.id AND ranked.rn > 1
+        """
+    )
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, generated_date
+                ORDER BY email_sent DESC NULLS LAST, id
+            ) AS rn
+            FROM digests
+        )
+        DELETE FROM digests
+        USING ranked
+        WHERE digests.id = ranked.id AND ranked.rn > 1
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_published_at",
+            "articles",
+            ["published_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "uq_digests_user_id_generated_date",
+            "digests",
+            ["user_id", "generated_date"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_digests_generated_date_email_sent",
+            "digests",
+            ["generated_date", "email_sent"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_users_interests",
+            "users",
+            ["interests"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_users_interests", table_name="users", postgresql_concurrently=True)
+        op.drop_index("ix_digests_generated_date_email_sent", table_name="digests", postgresql_concurrently=True)
+        op.drop_index("uq_digests_user_id_generated_date", table_name="digests", postgresql_concurrently=True)
+        op.drop_index("ix_articles_published_at", table_name="articles", postgresql_concurrently=True)
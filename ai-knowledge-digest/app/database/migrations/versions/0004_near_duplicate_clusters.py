@@ -0,0 +1,33 @@
+"""near-duplicate clusters on articles
+
+Revision ID: 0004_near_duplicate_clusters
+Revises: 0003_performance_indexes
+Create Date: 2026-10-18 11:30:00
+
+articles.cluster_id groups near-identical stories (MinHash/LSH at
+ingestion) and articles.minhash stores the signature. Existing rows stay
+NULL: each is its own cluster and is not matched against.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_near_duplicate_clusters"
+down_revision: Union[str, Sequence[str], None] = "0003_performance_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("articles", sa.Column("cluster_id", postgresql.UUID(as_uuid=True)))
+    op.add_column("articles", sa.Column("minhash", sa.LargeBinary()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("articles", "minhash")
+    op.drop_column("articles", "cluster_id")
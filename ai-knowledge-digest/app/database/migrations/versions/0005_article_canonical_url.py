@@ -0,0 +1,46 @@
+"""canonical URL dedup key on articles
+
+Revision ID: 0005_article_canonical_url
+Revises: 0004_near_duplicate_clusters
+Create Date: 2026-10-18 13:40:00
+
+articles.url keeps the URL as scraped (it is what digests link to);
+articles.canonical_url holds the utils.urls dedup key, unique so URL
+variants of one article cannot both be inserted. Existing rows stay
+NULL until `python -m scripts.backfill_canonical_urls` fills them;
+until then they are still matched on articles.url.
+
+Built CONCURRENTLY so large tables stay writable during the upgrade.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_article_canonical_url"
+down_revision: Union[str, Sequence[str], None] = "0004_near_duplicate_clusters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("articles", sa.Column("canonical_url", sa.String()))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_canonical_url",
+            "articles",
+            ["canonical_url"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_articles_canonical_url", table_name="articles", postgresql_concurrently=True)
+
+    op.drop_column("articles", "canonical_url")
@@ -9,6 +9,8 @@ from sqlalchemy import (
     Date,
     ForeignKey,
     Boolean,
+    Index,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -27,6 +29,10 @@ class User(Base):
 
     digests = relationship("Digest", back_populates="user")
 
+    __table_args__ = (
+        Index("ix_users_interests", "interests", postgresql_using="gin"),
+    )
+
 
 class Source(Base):
     __tablename__ = "sources"
@@ -46,14 +52,27 @@ class Article(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     source_id = Column(Integer, ForeignKey("sources.id"), nullable=True)
     title = Column(String, nullable=False)
-    url = Column(String, unique=True, nullable=False, index=True)
+    url = Column(String, unique=True, nullable=False, index=True)  # as scraped
+    canonical_url = Column(String, unique=True, index=True)  # dedup key, see utils.urls
     content_md = Column(Text)
+    content_text = Column(Text)  # cleaned, token-budgeted text (see ingestion.normalize)
     summary = Column(Text)
     takeaways = Column(ARRAY(String))
     topic = Column(String, index=True)
-    published_at = Column(DateTime)
+    published_at = Column(DateTime, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
+    # 'pending' until the enrichment workers fill summary/takeaways/topic,
+    # then 'done' (or 'failed' after ENRICHMENT_MAX_ATTEMPTS); near-duplicates
+    # of an earlier article are saved as 'duplicate' and never enriched
+    enrichment_status = Column(String, default="pending", nullable=False, index=True)
+    enrichment_attempts = Column(Integer, default=0, nullable=False)
+
+    # Near-duplicate cluster (see ingestion.dedup): id of the cluster's first
+    # article, which is its representative; minhash is the LSH signature
+    cluster_id = Column(UUID(as_uuid=True))
+    minhash = Column(LargeBinary)
+
     source = relationship("Source", back_populates="articles")
 
 
@@ -68,4 +87,29 @@ class Digest(Base):
 
     email_sent = Column(Boolean, default=False)
 
-    user = relationship("User", back_populates="digests")
\ No newline at end of file
+    user = relationship("User", back_populates="digests")
+
+    __table_args__ = (
+        Index("uq_digests_user_id_generated_date", "user_id", "generated_date", unique=True),
+        Index("ix_digests_generated_date_email_sent", "generated_date", "email_sent"),
+    )
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    digest_id = Column(UUID(as_uuid=True), ForeignKey("digests.id"), unique=True)
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+
+    # 'pending' until delivered ('sent'), or 'failed' after EMAIL_MAX_ATTEMPTS
+    status = Column(String, default="pending", nullable=False, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
+
+    digest = relationship("Digest")
@@ -1,56 +1,19 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+import multiprocessing
+import time
 import uuid
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.ai.circuit import CircuitOpenError
 from app.database.models import Digest, User, Article
 from app.config.logging import logger
-from app.ranking.ranker import ArticleRanker
-
-
-# --------------------------------------------------
-# CANONICAL TOPICS (SINGLE SOURCE OF TRUTH)
-# --------------------------------------------------
-CANONICAL_TOPICS = {
-    "ai": ["ai", "artificial intelligence", "llm", "llms", "chatgpt"],
-    "mlops": ["mlops", "devops", "cloud", "infrastructure"],
-    "startup": ["startup", "startups", "business", "founder", "saas"],
-    "product": ["product", "pm", "ux", "design"],
-    "vc": ["vc", "investment", "funding"],
-    "general": [],
-}
-
-
-# --------------------------------------------------
-# NORMALIZE AI TOPIC → CANONICAL
-# --------------------------------------------------
-def normalize_topic(raw_topic: str) -> str:
-    if not raw_topic:
-        return "general"
-
-    raw = raw_topic.lower()
-
-    for canonical, variants in CANONICAL_TOPICS.items():
-        if raw == canonical or raw in variants:
-            return canonical
-
-    return "general"
-
-
-# --------------------------------------------------
-# EXPAND USER INTERESTS
-# --------------------------------------------------
-def expand_interests(interests: list[str]) -> set[str]:
-    expanded = set()
-
-    for interest in interests or []:
-        key = interest.lower()
-        expanded.add(key)
-
-        for canonical, variants in CANONICAL_TOPICS.items():
-            if key == canonical or key in variants:
-                expanded.add(canonical)
-                expanded.update(variants)
-
-    return expanded
+from app.config.metrics import DIGESTS_GENERATED, USER_GENERATION_SECONDS, registry
+from app.config.settings import DATABASE_URL, GENERATOR_WORKERS
+from app.ranking.ranker import get_ranker
+from app.utils.topics import expand_interests, normalize_topic
 
 
 # --------------------------------------------------
@@ -60,24 +23,85 @@ class Generator:
     def __init__(self, db, processor):
         self.db = db
         self.processor = processor
-        self.ranker = ArticleRanker()
+        self.ranker = get_ranker()
 
     # --------------------------------------------------
     # MAIN ENTRY
     # --------------------------------------------------
-    def generate_for_all_users(self, db) -> int:
+    def generate_for_all_users(self, db, workers: int = GENERATOR_WORKERS) -> int:
         users = db.query(User).all()
 
         if not users:
             logger.warning("No users found. Skipping digest generation.")
             return 0
 
-        today = datetime.utcnow().date()
         since = datetime.utcnow() - timedelta(days=7)
 
+        # --------------------------------------------------
+        # SHARED CANDIDATE POOL (ONCE PER RUN, ENRICHED HERE ONLY)
+        # --------------------------------------------------
+        all_articles = self._load_candidate_pool(db, since)
+
+        if not all_articles:
+            logger.warning("No articles found for digest generation")
+            return 0
+
+        if workers > 1 and len(users) > 1:
+            return self._generate_sharded(users, since, workers)
+
+        return self.generate_for_users(db, users, all_articles)
+
+    # --------------------------------------------------
+    # MULTI-PROCESS: ONE SHARD OF USERS PER WORKER
+    # --------------------------------------------------
+    def _generate_sharded(self, users: list[User], since, workers: int) -> int:
+        """
+        Split users by id hash into `workers` shards and generate each in
+        its own process (own engine + session, see _generate_shard).
+        Shards are disjoint, and the per-(user, date) idempotency check
+        still guards against a digest being written twice.
+        """
+        shards = [[] for _ in range(workers)]
+        for user in users:
+            shards[user.id.int % workers].append(user.id)
+
+        shards = [shard for shard in shards if shard]
+        logger.info(f"Generating digests for {len(users)} users in {len(shards)} shards")
+
+        digest_count = 0
+
+        # spawn: workers must not inherit the parent's DB connections or threads
+        with ProcessPoolExecutor(
+            max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(_generate_shard, shard, since, len(shards)) for shard in shards
+            ]
+
+            for i, future in enumerate(futures):
+                try:
+                    count, metrics = future.result()
+                    registry.merge(metrics)
+                    logger.info(f"Shard {i} generated {count} digests")
+                    digest_count += count
+                except Exception as e:
+                    logger.error(f"Digest shard {i} failed: {e}")
+
+        return digest_count
+
+    # --------------------------------------------------
+    # PER-USER GENERATION OVER A PREPARED POOL
+    # --------------------------------------------------
+    def generate_for_users(self, db, users: list[User], all_articles: list[Article]) -> int:
+        today = datetime.utcnow().date()
+
+        topic_index = self._build_topic_index(all_articles)
+        self.ranker.prepare(all_articles, users)
+
         digest_count = 0
 
         for user in users:
+            start = time.perf_counter()
             logger.info(f"Generating digest for {user.email}")
 
             # --------------------------------------------------
@@ -102,50 +126,9 @@ class Generator:
             allowed_topics = expand_interests(user.interests or [])
 
             # --------------------------------------------------
-            # 3️⃣ FETCH ARTICLES
-            # --------------------------------------------------
-            all_articles = (
-                db.query(Article)
-                .filter(Article.published_at >= since)
-                .all()
-            )
-
-            if not all_articles:
-                logger.warning("No articles found for digest generation")
-                continue
-
+            # 3️⃣ SOFT INTEREST FILTER (NO HARD STOP)
             # --------------------------------------------------
-            # 4️⃣ AI SUMMARIZE + TOPIC TAG (SAFE)
-            # --------------------------------------------------
-            for article in all_articles:
-                if article.summary and article.topic:
-                    continue
-
-                try:
-                    ai = self.processor.summarize_article(
-                        article.content_md or ""
-                    )
-
-                    article.summary = ai.get("summary", "")
-                    article.takeaways = ai.get("takeaways", [])
-                    article.topic = normalize_topic(ai.get("topic"))
-
-                    db.add(article)
-
-                except Exception as e:
-                    logger.error(
-                        f"AI processing failed for article {article.id}: {e}"
-                    )
-
-            db.commit()
-
-            # --------------------------------------------------
-            # 5️⃣ SOFT INTEREST FILTER (NO HARD STOP)
-            # --------------------------------------------------
-            filtered_articles = [
-                a for a in all_articles
-                if a.topic in allowed_topics
-            ]
+            filtered_articles = self._lookup_topics(topic_index, allowed_topics)
 
             if not filtered_articles:
                 logger.warning(
@@ -154,7 +137,7 @@ class Generator:
                 filtered_articles = all_articles[:10]
 
             # --------------------------------------------------
-            # 6️⃣ RANK ARTICLES
+            # 4️⃣ RANK ARTICLES
             # --------------------------------------------------
             ranked = self.ranker.rank(filtered_articles, user)
             top_articles = ranked[:5]
@@ -166,7 +149,7 @@ class Generator:
                 continue
 
             # --------------------------------------------------
-            # 7️⃣ GENERATE OVERVIEW
+            # 5️⃣ GENERATE OVERVIEW
             # --------------------------------------------------
             try:
                 overview = self.processor.generate_overview(
@@ -180,7 +163,7 @@ class Generator:
                 overview = "Your AI knowledge digest for today."
 
             # --------------------------------------------------
-            # 8️⃣ SAVE DIGEST
+            # 6️⃣ SAVE DIGEST
             # --------------------------------------------------
             digest = Digest(
                 id=uuid.uuid4(),
@@ -193,10 +176,138 @@ class Generator:
             db.add(digest)
             db.commit()
 
+            USER_GENERATION_SECONDS.observe(time.perf_counter() - start)
+            DIGESTS_GENERATED.inc()
+
             logger.info(
                 f"Generated digest for {user.email} with {len(top_articles)} articles"
             )
 
             digest_count += 1
 
-        return digest_count
\ No newline at end of file
+        return digest_count
+
+    # --------------------------------------------------
+    # CANDIDATE POOL: FETCH WINDOW + AI SUMMARIZE + TOPIC TAG
+    # --------------------------------------------------
+    def _load_candidate_pool(self, db, since, enrich: bool = True) -> list[Article]:
+        query = db.query(Article).filter(Article.published_at >= since)
+
+        if enrich:
+            self._enrich_missing(db, self._one_per_cluster(query.all()))
+
+        # Reload once and detach, so the per-user digest commits don't
+        # expire the pool and trigger a refresh query per article.
+        articles = self._one_per_cluster(query.all())
+        for article in articles:
+            db.expunge(article)
+
+        logger.info(f"Loaded candidate pool of {len(articles)} articles")
+
+        return articles
+
+    @staticmethod
+    def _one_per_cluster(articles: list[Article]) -> list[Article]:
+        """
+        One article per near-duplicate cluster, so a story is enriched
+        and ranked once: the representative if it is in the pool,
+        otherwise the first member seen.
+        """
+        chosen = {}
+
+        for article in articles:
+            key = article.cluster_id or article.id
+            if key not in chosen or article.id == key:
+                chosen[key] = article
+
+        return list(chosen.values())
+
+    def _enrich_missing(self, db, articles: list[Article]):
+        for article in articles:
+            if article.summary and article.topic:
+                continue
+
+            try:
+                ai = self.processor.summarize_article(
+                    article.content_text or article.content_md or ""
+                )
+
+                # Placeholder after the model failed: leave it for the
+                # enrichment worker to retry rather than store it as done
+                if self.processor.is_fallback(ai):
+                    logger.warning(f"AI summary unavailable for article {article.id}")
+                    continue
+
+                article.summary = ai.get("summary", "")
+                article.takeaways = ai.get("takeaways", [])
+                article.topic = normalize_topic(ai.get("topic"))
+                article.enrichment_status = "done"
+
+                db.add(article)
+
+            except CircuitOpenError:
+                logger.warning("AI provider circuit is open, leaving the rest un-enriched")
+                break
+
+            except Exception as e:
+                logger.error(
+                    f"AI processing failed for article {article.id}: {e}"
+                )
+
+        db.commit()
+
+    # --------------------------------------------------
+    # TOPIC → ARTICLES INDEX
+    # --------------------------------------------------
+    @staticmethod
+    def _build_topic_index(articles: list[Article]) -> dict[str, list[tuple[int, Article]]]:
+        index: dict[str, list[tuple[int, Article]]] = {}
+
+        for position, article in enumerate(articles):
+            index.setdefault(article.topic, []).append((position, article))
+
+        return index
+
+    @staticmethod
+    def _lookup_topics(index: dict, allowed_topics: set[str]) -> list[Article]:
+        """Union of the index buckets for the given topics, in pool order."""
+        hits = []
+
+        for topic in allowed_topics:
+            hits.extend(index.get(topic, ()))
+
+        hits.sort(key=lambda x: x[0])
+
+        return [article for _, article in hits]
+
+
+# --------------------------------------------------
+# SHARD WORKER (RUNS IN A CHILD PROCESS)
+# --------------------------------------------------
+def _generate_shard(user_ids: list[uuid.UUID], since, shards: int) -> tuple[int, dict]:
+    """
+    Generate digests for one shard with a process-local engine and session,
+    and 1/shards of the OpenRouter rate limits (the limiter is per process).
+    Returns the digest count and this process's metrics for the parent to merge.
+    """
+    from app.ai.processor import Processor  # lazy: only needed in the worker
+    from app.ai.ratelimit import share_limits
+
+    share_limits(shards)
+
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    try:
+        users = db.query(User).filter(User.id.in_(user_ids)).all()
+        generator = Generator(db, Processor())
+
+        # The parent already enriched the pool; workers only read it
+        articles = generator._load_candidate_pool(db, since, enrich=False)
+
+        count = generator.generate_for_users(db, users, articles)
+        return count, registry.snapshot()
+
+    finally:
+        db.close()
+        engine.dispose()
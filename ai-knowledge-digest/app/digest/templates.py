@@ -1,51 +1,22 @@
+import threading
+from collections import OrderedDict
 from datetime import date
-import html
+from functools import lru_cache
 
+from jinja2 import Environment
+from markupsafe import Markup, escape
 
-class Templates:
-    @staticmethod
-    def get_email_template(overview: str, articles: list[dict]) -> str:
-        today = date.today().strftime("%B %d, %Y")
-
-        def safe(text: str) -> str:
-            """Escape + clean AI output for email"""
-            if not text:
-                return ""
-            text = text.replace("```", "").strip()
-            return html.escape(text)
-
-        articles_html = ""
-
-        for article in articles:
-            title = safe(article.get("title", "Untitled"))
-            summary = safe(article.get("summary", ""))
-            url = article.get("url", "#")
-            source = article.get("source", "").lower()
-
-            # Badge
-            badge = ""
-            if source == "youtube":
-                badge = """
-                <span style="background:#ff0000;color:#fff;
-                             padding:3px 8px;border-radius:12px;
-                             font-size:11px;margin-left:6px;">
-                  YouTube
-                </span>
-                """
-            elif source == "newsletter":
-                badge = """
-                <span style="background:#34a853;color:#fff;
-                             padding:3px 8px;border-radius:12px;
-                             font-size:11px;margin-left:6px;">
-                  Newsletter
-                </span>
-                """
+from app.config.settings import EMAIL_FRAGMENT_CACHE_SIZE
+
+# Bump whenever ARTICLE_TEMPLATE / EMAIL_TEMPLATE change so cached fragments are not reused
+TEMPLATE_VERSION = "email-v1"
 
-            articles_html += f"""
+
+ARTICLE_TEMPLATE = """
             <tr>
               <td style="padding-top:25px;">
                 <h3 style="margin:0;font-size:18px;color:#111;">
-                  {title}{badge}
+                  {{ title | clean }}{{ badge }}
                 </h3>
               </td>
             </tr>
@@ -55,13 +26,13 @@ class Templates:
                          font-size:14px;
                          color:#333;
                          line-height:1.6;">
-                {summary}
+                {{ summary | clean }}
               </td>
             </tr>
 
             <tr>
               <td style="padding-top:10px;">
-                <a href="{url}"
+                <a href="{{ url }}"
                    style="color:#1a73e8;
                           text-decoration:none;
                           font-size:14px;">
@@ -77,7 +48,24 @@ class Templates:
             </tr>
             """
 
-        return f"""
+BADGES = {
+    "youtube": Markup("""
+                <span style="background:#ff0000;color:#fff;
+                             padding:3px 8px;border-radius:12px;
+                             font-size:11px;margin-left:6px;">
+                  YouTube
+                </span>
+                """),
+    "newsletter": Markup("""
+                <span style="background:#34a853;color:#fff;
+                             padding:3px 8px;border-radius:12px;
+                             font-size:11px;margin-left:6px;">
+                  Newsletter
+                </span>
+                """),
+}
+
+EMAIL_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -110,7 +98,7 @@ class Templates:
             <p style="margin:6px 0 0;
                       font-size:13px;
                       color:#777;">
-              {today}
+              {{ today }}
             </p>
           </td>
         </tr>
@@ -136,12 +124,12 @@ class Templates:
                      font-size:14px;
                      color:#333;
                      line-height:1.6;">
-            {safe(overview)}
+            {{ overview }}
           </td>
         </tr>
 
         <!-- Articles -->
-        {articles_html}
+        {{ articles_html }}
 
         <!-- Footer -->
         <tr>
@@ -162,4 +150,118 @@ class Templates:
 
 </body>
 </html>
-"""
\ No newline at end of file
+"""
+
+
+def clean(text: str) -> str:
+    """Clean AI output for email (escaping is done by autoescape)"""
+    if not text:
+        return ""
+    return text.replace("```", "").strip()
+
+
+# Compiled once at import; autoescape replaces the old per-call html.escape
+_env = Environment(autoescape=True)
+_env.filters["clean"] = clean
+_article_template = _env.from_string(ARTICLE_TEMPLATE)
+_email_template = _env.from_string(EMAIL_TEMPLATE)
+
+_OVERVIEW_SLOT = Markup("\x00overview\x00")
+_ARTICLES_SLOT = Markup("\x00articles\x00")
+
+
+class FragmentCache:
+    """
+    LRU of rendered article fragments. Reads take no lock (dict lookups
+    and move_to_end are atomic under the GIL); inserts and eviction do.
+    """
+
+    def __init__(self, max_entries: int = EMAIL_FRAGMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        fragment = self._entries.get(key)
+        if fragment is None:
+            self.misses += 1
+            return None
+
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            pass  # evicted by another thread meanwhile; still a valid render
+
+        self.hits += 1
+        return fragment
+
+    def put(self, key, fragment: str):
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+fragment_cache = FragmentCache()
+
+
+@lru_cache(maxsize=4)
+def _shell(today: date) -> tuple[str, str, str]:
+    """
+    The email rendered once per day with placeholder slots, split into
+    the static parts around the overview and the article list.
+    """
+    rendered = _email_template.render(
+        today=today.strftime("%B %d, %Y"),
+        overview=_OVERVIEW_SLOT,
+        articles_html=_ARTICLES_SLOT,
+    )
+    head, rest = rendered.split(_OVERVIEW_SLOT)
+    middle, tail = rest.split(_ARTICLES_SLOT)
+    return head, middle, tail
+
+
+class Templates:
+    @staticmethod
+    def render_article(article: dict) -> str:
+        """
+        One article's rows. Cached by (article id, TEMPLATE_VERSION), so a
+        popular article is rendered once for every recipient who gets it.
+        """
+        key = (article["id"], TEMPLATE_VERSION) if article.get("id") else None
+
+        if key:
+            fragment = fragment_cache.get(key)
+            if fragment is not None:
+                return fragment
+
+        fragment = _article_template.render(
+            title=article.get("title", "Untitled"),
+            summary=article.get("summary", ""),
+            url=article.get("url", "#"),
+            badge=BADGES.get(article.get("source", "").lower(), ""),
+        )
+
+        if key:
+            fragment_cache.put(key, fragment)
+
+        return fragment
+
+    @staticmethod
+    def get_email_template(overview: str, articles: list[dict]) -> str:
+        head, middle, tail = _shell(date.today())
+
+        return "".join(
+            (
+                head,
+                escape(clean(overview)),
+                middle,
+                *(Templates.render_article(article) for article in articles),
+                tail,
+            )
+        )
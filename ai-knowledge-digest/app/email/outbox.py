@@ -0,0 +1,204 @@
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config.logging import logger
+from app.config.settings import (
+    EMAIL_DISPATCH_WORKERS,
+    EMAIL_MAX_ATTEMPTS,
+    EMAIL_RETRY_BASE_SECONDS,
+    EMAIL_RETRY_MAX_SECONDS,
+    EMAIL_DISPATCH_LINGER_SECONDS,
+    SMTP_POOL_SIZE,
+)
+from app.database.db import SessionLocal
+from app.database.models import Digest, EmailOutbox
+from app.email.sender import PooledEmailSender
+
+
+def enqueue(db, messages: list[dict]) -> int:
+    """
+    Queue rendered digest emails (dicts with digest_id, recipient, subject,
+    body) in one executemany INSERT. One outbox row per digest: enqueueing
+    the same digest again is a no-op. Returns rows queued; the caller commits.
+    """
+    if not messages:
+        return 0
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "digest_id": message["digest_id"],
+            "recipient": message["recipient"],
+            "subject": message["subject"],
+            "body": message["body"],
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now,
+        }
+        for message in messages
+    ]
+
+    table = EmailOutbox.__table__
+    stmt = (
+        insert(table)
+        .on_conflict_do_nothing(index_elements=[table.c.digest_id])
+        .returning(table.c.id)
+    )
+    return len(db.execute(stmt, rows).all())
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter for the `attempts`-th failure."""
+    delay = min(EMAIL_RETRY_MAX_SECONDS, EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class OutboxDispatcher:
+    """
+    Drains due 'pending' outbox rows over a pool of SMTP connections.
+
+    Like EnrichmentWorker, each worker thread has its own session. It
+    claims one row with SELECT ... FOR UPDATE SKIP LOCKED, sends it and
+    commits the outcome before claiming the next, so a crash re-sends at
+    most the message in flight and a slow recipient holds up nothing
+    else. Failures are rescheduled with exponential backoff and recorded
+    in last_error; retries falling due within `linger` seconds are waited
+    for before run() returns.
+    """
+
+    def __init__(
+        self,
+        workers: int = EMAIL_DISPATCH_WORKERS,
+        connections: int = SMTP_POOL_SIZE,
+        max_attempts: int = EMAIL_MAX_ATTEMPTS,
+        linger: float = EMAIL_DISPATCH_LINGER_SECONDS,
+        sender: PooledEmailSender = None,
+    ):
+        self.workers = workers
+        self.connections = connections
+        self.max_attempts = max_attempts
+        self.linger = linger
+        self.sender = sender
+
+    def run(self) -> int:
+        """Dispatch the outbox; returns the number of emails sent."""
+        sender = self.sender or PooledEmailSender(connections=self.connections)
+        deadline = time.monotonic() + self.linger
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="outbox"
+            ) as pool:
+                futures = [
+                    pool.submit(self._drain, sender, deadline)
+                    for _ in range(self.workers)
+                ]
+                sent = sum(f.result() for f in futures)
+
+        finally:
+            if self.sender is None:
+                sender.close()
+
+        logger.info(f"Dispatched {sent} emails with {self.workers} workers")
+        return sent
+
+    # --------------------------------------------------
+    # Worker loop
+    # --------------------------------------------------
+    def _drain(self, sender: PooledEmailSender, deadline: float) -> int:
+        db = SessionLocal()
+        sent = 0
+
+        try:
+            while True:
+                message = self._claim(db)
+
+                if message is None:
+                    db.rollback()
+                    wait = self._next_due_in(db)
+                    if wait is None or time.monotonic() + wait > deadline:
+                        break
+                    time.sleep(max(wait, 0.1))
+                    continue
+
+                delivered = self._deliver(sender, message)
+                if delivered:
+                    db.execute(
+                        update(Digest)
+                        .where(Digest.id == message.digest_id)
+                        .values(email_sent=True)
+                    )
+
+                # Right after the send: the row lock is released and the
+                # outcome is durable before the next message goes out
+                db.commit()
+                sent += delivered
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Outbox worker stopped: {e}")
+
+        finally:
+            db.close()
+
+        return sent
+
+    def _claim(self, db):
+        """Lock the next due message (skipping rows other workers hold), or None."""
+        return db.scalar(
+            select(EmailOutbox)
+            .where(
+                EmailOutbox.status == "pending",
+                EmailOutbox.next_attempt_at <= datetime.utcnow(),
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+
+    def _next_due_in(self, db):
+        """Seconds until the earliest pending retry, or None if none left."""
+        next_at = db.scalar(
+            select(func.min(EmailOutbox.next_attempt_at)).where(
+                EmailOutbox.status == "pending"
+            )
+        )
+        if next_at is None:
+            return None
+        return (next_at - datetime.utcnow()).total_seconds()
+
+    def _deliver(self, sender: PooledEmailSender, message: EmailOutbox) -> bool:
+        message.attempts += 1
+
+        try:
+            sender.send_email(
+                recipient=message.recipient,
+                subject=message.subject,
+                body=message.body,
+            )
+
+        except Exception as e:
+            message.last_error = str(e)[:1000]
+
+            if message.attempts >= self.max_attempts:
+                message.status = "failed"
+                logger.error(f"Giving up on email to {message.recipient}: {e}")
+            else:
+                message.next_attempt_at = datetime.utcnow() + timedelta(
+                    seconds=retry_delay(message.attempts)
+                )
+
+            return False
+
+        message.status = "sent"
+        message.sent_at = datetime.utcnow()
+        message.last_error = None
+        return True
@@ -1,4 +1,7 @@
+import queue
 import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
@@ -7,12 +10,37 @@ from app.config.settings import (
     SMTP_PORT,
     SMTP_USER,
     SMTP_PASSWORD,
+    SMTP_USE_TLS,
+    SMTP_POOL_SIZE,
+    SMTP_MAX_MESSAGES_PER_CONNECTION,
     FROM_EMAIL,
+    REQUEST_TIMEOUT,
 )
 from app.config.logging import logger
+from app.config.metrics import SMTP_SEND_SECONDS
 
 
 class EmailSender:
+    """One SMTP connection (connect, STARTTLS, login) per message."""
+
+    def __init__(
+        self,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        user: str = SMTP_USER,
+        password: str = SMTP_PASSWORD,
+        use_tls: bool = SMTP_USE_TLS,
+        timeout: int = REQUEST_TIMEOUT,
+        from_email: str = FROM_EMAIL,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.from_email = from_email
+
     def send_email(
         self,
         to_email: str = None,
@@ -29,7 +57,38 @@ class EmailSender:
         - to_email / recipient
         - html / body / html_content
         """
+        email, msg = self._build_message(
+            to_email=to_email,
+            recipient=recipient,
+            subject=subject,
+            html_content=html_content,
+            body=body,
+            html=html,
+        )
 
+        start = time.perf_counter()
+        try:
+            with self._connect() as server:
+                server.sendmail(self.from_email, email, msg.as_string())
+
+            SMTP_SEND_SECONDS.observe(time.perf_counter() - start, status="ok")
+            logger.info(f"Email sent to {email}")
+
+        except Exception as e:
+            SMTP_SEND_SECONDS.observe(time.perf_counter() - start, status="error")
+            logger.error(f"Failed to send email to {email}: {e}")
+            raise
+
+    def _build_message(
+        self,
+        to_email: str = None,
+        recipient: str = None,
+        subject: str = "",
+        html_content: str = None,
+        body: str = None,
+        html: str = None,
+        **kwargs,
+    ):
         # ✅ resolve recipient
         email = to_email or recipient
         if not email:
@@ -41,20 +100,141 @@ class EmailSender:
             raise ValueError("Email content not provided")
 
         msg = MIMEMultipart("alternative")
-        msg["From"] = FROM_EMAIL
+        msg["From"] = self.from_email
         msg["To"] = email
         msg["Subject"] = subject
 
         msg.attach(MIMEText(content, "html"))
 
+        return email, msg
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+
         try:
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
+            if self.use_tls:
                 server.starttls()
-                server.login(SMTP_USER, SMTP_PASSWORD)
-                server.sendmail(FROM_EMAIL, email, msg.as_string())
+            if self.user:
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+
+        return server
+
+
+class PooledEmailSender(EmailSender):
+    """
+    Keeps up to `connections` authenticated SMTP sessions open and sends
+    many messages over each one.
+    - A connection is recycled after `max_messages` messages (provider limit)
+    - A dropped connection is reopened and the message retried once
+    - send_many() sends a batch over all connections concurrently
+    Use as a context manager, or call close(), to QUIT the sessions.
+    """
 
+    def __init__(
+        self,
+        connections: int = SMTP_POOL_SIZE,
+        max_messages: int = SMTP_MAX_MESSAGES_PER_CONNECTION,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.connections = connections
+        self.max_messages = max_messages
+
+        # Slots are [server or None, messages sent on it]; opened lazily
+        self._slots = queue.Queue()
+        for _ in range(connections):
+            self._slots.put([None, 0])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def send_email(self, **kwargs):
+        email, msg = self._build_message(**kwargs)
+        payload = msg.as_string()
+
+        slot = self._slots.get()
+        start = time.perf_counter()  # after the wait for a free connection
+        try:
+            try:
+                self._send_on(slot, email, payload)
+            except Exception as e:
+                if not self._is_disconnect(e):
+                    raise
+
+                # Server hung up (idle timeout, restart): reconnect, retry once
+                logger.warning(f"SMTP connection dropped ({e}), reconnecting")
+                self._drop(slot)
+                self._send_on(slot, email, payload)
+
+            SMTP_SEND_SECONDS.observe(time.perf_counter() - start, status="ok")
             logger.info(f"Email sent to {email}")
 
         except Exception as e:
+            SMTP_SEND_SECONDS.observe(time.perf_counter() - start, status="error")
             logger.error(f"Failed to send email to {email}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+        finally:
+            self._slots.put(slot)
+
+    def send_many(self, messages: list):
+        """
+        Send a batch of send_email() kwargs dicts over the pool.
+        Yields (index, error) as each message finishes; error is None
+        on success, so callers can record progress as it happens.
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.connections, thread_name_prefix="smtp"
+        ) as pool:
+            futures = {
+                pool.submit(self.send_email, **message): i
+                for i, message in enumerate(messages)
+            }
+
+            for future in as_completed(futures):
+                yield futures[future], future.exception()
+
+    def close(self):
+        for _ in range(self.connections):
+            slot = self._slots.get()
+            if slot[0] is not None:
+                try:
+                    slot[0].quit()
+                except Exception:
+                    pass
+                slot[0], slot[1] = None, 0
+            self._slots.put(slot)
+
+    @staticmethod
+    def _is_disconnect(error: Exception) -> bool:
+        # 421: server is closing the channel (often a per-session limit)
+        if isinstance(error, smtplib.SMTPResponseException):
+            return error.smtp_code == 421
+        return isinstance(error, (smtplib.SMTPServerDisconnected, ConnectionError))
+
+    def _send_on(self, slot: list, email: str, payload: str):
+        if slot[0] is not None and slot[1] >= self.max_messages:
+            self._drop(slot, quit=True)
+
+        if slot[0] is None:
+            slot[0], slot[1] = self._connect(), 0
+
+        slot[0].sendmail(self.from_email, email, payload)
+        slot[1] += 1
+
+    def _drop(self, slot: list, quit: bool = False):
+        try:
+            if quit:
+                slot[0].quit()
+            elif slot[0] is not None:
+                slot[0].close()
+        except Exception:
+            pass
+
+        slot[0], slot[1] = None, 0
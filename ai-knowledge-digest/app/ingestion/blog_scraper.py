@@ -1,6 +1,6 @@
-import feedparser
 from datetime import datetime
 from app.config.logging import logger
+from app.ingestion.fetcher import FeedFetcher
 
 
 class BlogScraper:
@@ -14,12 +14,18 @@ class BlogScraper:
 
     SOURCE_NAME = "Blog"  
 
+    def __init__(self, fetcher: FeedFetcher = None):
+        self.fetcher = fetcher or FeedFetcher()
+
     def scrape(self) -> list:
         articles = []
+        feeds = self.fetcher.fetch_all(self.FEED_URLS)
 
         for feed_url in self.FEED_URLS:
             try:
-                feed = feedparser.parse(feed_url)
+                feed = feeds[feed_url]
+                if isinstance(feed, Exception):
+                    raise feed
 
                 for entry in feed.entries[:10]:
                     articles.append(
@@ -0,0 +1,142 @@
+import zlib
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select
+
+from app.config.settings import NEAR_DUP_THRESHOLD
+from app.database.models import Article
+from app.ingestion.normalize import WORD
+
+# Signatures are stored on articles.minhash: changing any of these
+# (or the seed) makes new signatures incomparable with stored ones.
+NUM_PERM = 128
+BANDS = 32  # x 4 rows: candidate pairs from ~0.42 Jaccard up
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 3
+# Below this many distinct shingles (~a short paragraph) the text is too
+# short or too boilerplate ("Comments", a bare title) to say two articles
+# tell the same story, so it is not fingerprinted at all
+MIN_SHINGLES = 20
+
+_rng = np.random.RandomState(1)
+# Multiply-shift hashing: h(x) = (a * x + b) mod 2**64 >> 32, a odd
+_A = _rng.randint(1, 1 << 63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.randint(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+_SHIFT = np.uint64(32)
+
+# Combine consecutive word hashes into one shingle hash (mod 2**64)
+_SHINGLE_MULTIPLIERS = [np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F)]
+
+
+def shingles(text: str) -> np.ndarray:
+    """
+    Distinct hashes of every SHINGLE_WORDS-word window of the text: each
+    word is hashed once (crc32) and the windows are combined with numpy.
+    """
+    words = WORD.findall((text or "").lower())
+    hashes = np.fromiter(
+        (zlib.crc32(w.encode()) for w in words), dtype=np.uint64, count=len(words)
+    )
+
+    if len(words) < SHINGLE_WORDS:
+        return np.unique(hashes)
+
+    n = len(words) - SHINGLE_WORDS + 1
+    combined = hashes[SHINGLE_WORDS - 1:].copy()
+    for offset, multiplier in enumerate(_SHINGLE_MULTIPLIERS):
+        combined += hashes[offset:offset + n] * multiplier
+
+    return np.unique(combined)
+
+
+def signature(text: str) -> Optional[np.ndarray]:
+    """
+    MinHash signature (NUM_PERM uint32s) of the text's shingles, computed
+    for all permutations at once with numpy. None for text with fewer
+    than MIN_SHINGLES shingles.
+    """
+    values = shingles(text)
+    if len(values) < MIN_SHINGLES:
+        return None
+
+    # (shingles x NUM_PERM), updated in place to avoid two more copies
+    permuted = np.outer(values, _A)
+    permuted += _B
+    permuted >>= _SHIFT
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """
+    LSH index over MinHash signatures of the recent article window.
+
+    Each signature is split into BANDS bands; articles sharing any band
+    are candidates, and a candidate whose estimated Jaccard similarity
+    reaches `threshold` is a near-duplicate. A cluster is named after its
+    first article (cluster_id == id for the representative).
+
+    A bucket keeps one article per cluster, so a story syndicated many
+    times costs at most one comparison per band rather than one per copy.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUP_THRESHOLD):
+        self.threshold = threshold
+
+        # band → band key → cluster_id → first article of that cluster seen with the key
+        self._buckets: list[dict[bytes, dict]] = [{} for _ in range(BANDS)]
+        self._entries: dict = {}  # article id → (signature, cluster_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def load(cls, db, since: datetime, **kwargs) -> "NearDuplicateIndex":
+        """Index every article created since `since` that has a signature."""
+        index = cls(**kwargs)
+
+        rows = db.execute(
+            select(Article.id, Article.cluster_id, Article.minhash).where(
+                Article.created_at >= since,
+                Article.minhash.is_not(None),
+            )
+        )
+        for article_id, cluster_id, minhash in rows:
+            index.add(
+                article_id,
+                cluster_id or article_id,
+                np.frombuffer(minhash, dtype=np.uint32),
+            )
+
+        return index
+
+    def add(self, article_id, cluster_id, sig: np.ndarray):
+        self._entries[article_id] = (sig, cluster_id)
+
+        for band, bucket in enumerate(self._buckets):
+            bucket.setdefault(self._band_key(sig, band), {}).setdefault(cluster_id, article_id)
+
+    def match(self, sig: np.ndarray):
+        """cluster_id of the first candidate reaching the threshold, or None."""
+        checked = set()
+
+        for band, bucket in enumerate(self._buckets):
+            for cluster_id, article_id in bucket.get(self._band_key(sig, band), {}).items():
+                if article_id in checked:
+                    continue
+                checked.add(article_id)
+
+                if similarity(sig, self._entries[article_id][0]) >= self.threshold:
+                    return cluster_id
+
+        return None
+
+    @staticmethod
+    def _band_key(sig: np.ndarray, band: int) -> bytes:
+        return sig[band * ROWS:(band + 1) * ROWS].tobytes()
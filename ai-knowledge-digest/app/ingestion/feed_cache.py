@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+import feedparser
+
+from app.config.settings import FEED_CACHE_DIR
+from app.config.logging import logger
+from app.utils.files import atomic_write_text
+
+
+class FeedCache:
+    """
+    Persistent per-feed cache for conditional GETs.
+    One JSON file per feed URL holding its ETag, Last-Modified and the
+    last parsed feed's metadata and entries, so a 304 can be served
+    without re-parsing. JSON, not pickle: loading the cache directory
+    must never run code.
+    """
+
+    def __init__(self, directory: str = FEED_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, url: str) -> Optional[dict]:
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                entry = json.load(f)
+
+            entry["feed"] = _feed_dict(entry["feed"])
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache for {url}: {e}")
+            return None
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], feed):
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            # What the scrapers read; *_parsed time tuples become lists
+            "feed": {"feed": feed.get("feed", {}), "entries": feed.get("entries", [])},
+        }
+
+        atomic_write_text(self._path(url), json.dumps(entry, default=str))
+
+    def conditional_headers(self, url: str) -> tuple[dict, Optional[dict]]:
+        """Request headers for a conditional GET, plus the cached entry."""
+        cached = self.get(url)
+        headers = {}
+
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        return headers, cached
+
+
+def _feed_dict(value):
+    """JSON back into FeedParserDicts, so `feed.entries` / `entry.content` work."""
+    if isinstance(value, dict):
+        return feedparser.FeedParserDict({k: _feed_dict(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_feed_dict(v) for v in value]
+    return value
@@ -0,0 +1,137 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config.settings import (
+    FEED_FETCH_WORKERS,
+    FEED_FETCH_PER_HOST,
+    REQUEST_TIMEOUT,
+)
+from app.config.logging import logger
+from app.config.metrics import FEED_ENTRIES, FEED_FETCH_SECONDS
+from app.ingestion.feed_cache import FeedCache
+
+
+class FeedFetcher:
+    """
+    Shared fetch layer for the scrapers.
+    - Downloads feeds concurrently on one thread pool
+    - Caps in-flight requests per host
+    - Reuses keep-alive connections through a pooled Session
+    - Sends conditional GETs and skips parsing entirely on 304
+    - Hands the downloaded bytes to feedparser
+    """
+
+    USER_AGENT = "AI-Knowledge-Digest/1.0 (+feedparser)"
+
+    def __init__(
+        self,
+        max_workers: int = FEED_FETCH_WORKERS,
+        per_host: int = FEED_FETCH_PER_HOST,
+        timeout: int = REQUEST_TIMEOUT,
+        cache: FeedCache = None,
+    ):
+        self.timeout = timeout
+        self.per_host = per_host
+        self.cache = cache or FeedCache()
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = self.USER_AGENT
+
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=per_host)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="feed-fetch"
+        )
+        self._host_slots: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    # --------------------------------------------------
+    # Fetch
+    # --------------------------------------------------
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.Semaphore(self.per_host)
+
+        return slot
+
+    def fetch(self, url: str) -> feedparser.FeedParserDict:
+        start = time.perf_counter()
+
+        try:
+            feed, status = self._fetch(url)
+        except Exception:
+            FEED_FETCH_SECONDS.observe(time.perf_counter() - start, feed=url, status="error")
+            raise
+
+        FEED_FETCH_SECONDS.observe(time.perf_counter() - start, feed=url, status=status)
+        FEED_ENTRIES.set(len(feed.entries), feed=url)
+        return feed
+
+    def _fetch(self, url: str) -> tuple[feedparser.FeedParserDict, str]:
+        headers, cached = self.cache.conditional_headers(url)
+
+        with self._host_slot(url):
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached:
+            return cached["feed"], "not_modified"
+
+        response.raise_for_status()
+
+        feed = feedparser.parse(
+            response.content,
+            response_headers={
+                "content-location": response.url,
+                "content-type": response.headers.get("Content-Type", ""),
+            },
+        )
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if etag or last_modified:
+            try:
+                self.cache.put(url, etag, last_modified, feed)
+            except Exception as e:
+                logger.warning(f"Could not cache feed {url}: {e}")
+
+        return feed, "ok"
+
+    def fetch_all(self, urls: list[str]) -> dict:
+        """
+        Fetch every URL concurrently.
+        Returns {url: parsed feed}, or {url: exception} for feeds that
+        failed, so each scraper can report errors the way it always has.
+        """
+        futures = {url: self._executor.submit(self.fetch, url) for url in urls}
+        results = {}
+
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                results[url] = e
+
+        return results
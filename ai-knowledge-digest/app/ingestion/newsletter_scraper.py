@@ -1,6 +1,6 @@
-import feedparser
 from datetime import datetime
 from app.config.logging import logger
+from app.ingestion.fetcher import FeedFetcher
 
 
 class NewsletterScraper:
@@ -35,12 +35,18 @@ class NewsletterScraper:
         },
     ]
 
+    def __init__(self, fetcher: FeedFetcher = None):
+        self.fetcher = fetcher or FeedFetcher()
+
     def scrape(self):
         articles = []
+        parsed_feeds = self.fetcher.fetch_all([feed["url"] for feed in self.FEEDS])
 
         for feed in self.FEEDS:
             try:
-                parsed = feedparser.parse(feed["url"])
+                parsed = parsed_feeds[feed["url"]]
+                if isinstance(parsed, Exception):
+                    raise parsed
 
                 for entry in parsed.entries[:5]:
                     content = ""
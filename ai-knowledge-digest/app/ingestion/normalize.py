@@ -0,0 +1,121 @@
+import re
+from collections import Counter
+
+from bs4 import BeautifulSoup
+
+from app.config.settings import CONTENT_TOKEN_BUDGET
+
+# Elements that never carry article text
+BOILERPLATE_TAGS = [
+    "script", "style", "noscript", "iframe", "svg", "form", "button",
+    "nav", "header", "footer", "aside", "figure",
+]
+
+# Feed/newsletter chrome that survives tag stripping: whole-word phrases,
+# and a sentence is only dropped if it is short and mostly made of them
+# ("Subscribe to our newsletter." goes, "Netflix subscribers grew." stays)
+BOILERPLATE_PHRASE = re.compile(
+    r"\b(?:"
+    r"(?:subscribe|sign up)(?: (?:now|today|here|for free))?"
+    r"(?: (?:to|for) (?:our|the|my|this) (?:newsletter|channel|podcast|blog|feed|mailing list|updates))?"
+    r"|unsubscribe(?: here)?"
+    r"|share this(?: (?:post|article|story))?(?: on \w+)?"
+    r"|continue reading(?: on \w+)?"
+    r"|read more(?: (?:here|at|on) \w+)?"
+    r"|click here(?: to \w+(?: \w+)?)?"
+    r"|the post .+ appeared first on .+"
+    r"|all rights reserved"
+    r"|view (?:this email )?in (?:your )?browser"
+    r")\b",
+    re.IGNORECASE,
+)
+BOILERPLATE_MAX_WORDS = 12
+
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[\"'(A-Z0-9])")
+WORD = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    """a an and are as at be but by for from has have he her his i in is it its
+    of on or our she that the their them they this to was we were what when
+    which who will with you your not can all more new about also than into""".split()
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for budgets."""
+    return len(text or "") // 4
+
+
+def html_to_text(raw: str) -> str:
+    """Strip markup and boilerplate elements, collapse whitespace."""
+    if not raw:
+        return ""
+
+    if "<" in raw and ">" in raw:
+        soup = BeautifulSoup(raw, "html.parser")
+        for tag in soup(BOILERPLATE_TAGS):
+            tag.decompose()
+        raw = soup.get_text(" ")
+
+    return " ".join(raw.split())
+
+
+def is_boilerplate(sentence: str) -> bool:
+    """Short sentence at least half made of BOILERPLATE_PHRASE words."""
+    words = sentence.split()
+    if not words or len(words) > BOILERPLATE_MAX_WORDS:
+        return False
+
+    matched = sum(len(m.group(0).split()) for m in BOILERPLATE_PHRASE.finditer(sentence))
+    return matched * 2 >= len(words)
+
+
+def split_sentences(text: str, max_words: int = 60) -> list[str]:
+    """Sentence split; unpunctuated runs (e.g. transcripts) are chunked by words."""
+    sentences = []
+
+    for sentence in SENTENCE_SPLIT.split(text):
+        words = sentence.split()
+        for i in range(0, len(words), max_words):
+            sentences.append(" ".join(words[i:i + max_words]))
+
+    return sentences
+
+
+def extract_key_sentences(text: str, token_budget: int = CONTENT_TOKEN_BUDGET) -> str:
+    """
+    Keep the most informative sentences that fit the token budget, in
+    their original order. Sentences are scored by the average corpus
+    frequency of their content words, with a small boost for the lead.
+    """
+    sentences = [s for s in split_sentences(text) if not is_boilerplate(s)]
+
+    if estimate_tokens(" ".join(sentences)) <= token_budget:
+        return " ".join(sentences)
+
+    words = [
+        [w for w in WORD.findall(s.lower()) if w not in STOPWORDS]
+        for s in sentences
+    ]
+    freq = Counter(w for ws in words for w in ws)
+
+    def score(i: int) -> float:
+        if not words[i]:
+            return 0.0
+        lead = 1.5 if i < 2 else 1.0
+        return lead * sum(freq[w] for w in words[i]) / len(words[i])
+
+    chosen, used = [], 0
+    for i in sorted(range(len(sentences)), key=score, reverse=True):
+        cost = estimate_tokens(sentences[i]) + 1
+        if used + cost > token_budget:
+            continue
+        chosen.append(i)
+        used += cost
+
+    return " ".join(sentences[i] for i in sorted(chosen))
+
+
+def normalize_content(raw: str, token_budget: int = CONTENT_TOKEN_BUDGET) -> str:
+    """Raw feed HTML / transcript → clean, budgeted text for LLM + ranking."""
+    return extract_key_sentences(html_to_text(raw), token_budget)
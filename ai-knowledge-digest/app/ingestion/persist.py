@@ -1,61 +1,179 @@
-from datetime import datetime
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
 from app.database.models import Article, Source
 from app.config.logging import logger
-from app.ai.processor import Processor
+from app.config.metrics import (
+    ARTICLES_KNOWN,
+    ARTICLES_NEAR_DUPLICATE,
+    ARTICLES_SAVED,
+    SAVE_ARTICLES_ROWS_PER_SECOND,
+    SAVE_ARTICLES_SECONDS,
+)
+from app.config.settings import NEAR_DUP_WINDOW_DAYS
+from app.ingestion.dedup import NearDuplicateIndex, signature
+from app.ingestion.normalize import normalize_content
+from app.ingestion.seen_urls import SeenUrls, get_seen_urls
+from app.utils.urls import canonicalize_url
+
+# Rows per lookup / INSERT statement
+BATCH_SIZE = 1000
+
+
+def existing_urls(db, urls, column=Article.url) -> set:
+    """Return the subset of urls already stored in `column`, one query per batch."""
+    urls = list(urls)
+    found = set()
+
+    for i in range(0, len(urls), BATCH_SIZE):
+        chunk = urls[i:i + BATCH_SIZE]
+        found.update(db.scalars(select(column).where(column.in_(chunk))))
+
+    return found
+
+
+def known_urls(db, urls: dict[str, str], seen: SeenUrls = None) -> set[str]:
+    """
+    The canonical URLs (keys of {canonical: as scraped}) already stored.
+    A Bloom filter miss is new without a query; hits are confirmed on
+    articles.canonical_url, then on articles.url as scraped for rows saved
+    before the canonical_url backfill.
+    """
+    seen = seen or get_seen_urls()
+    maybe = {canonical: raw for canonical, raw in urls.items() if canonical in seen}
+
+    if not maybe:
+        return set()
+
+    found = existing_urls(db, maybe, column=Article.canonical_url)
+    rest = {canonical: raw for canonical, raw in maybe.items() if canonical not in found}
+
+    if rest:
+        found_raw = existing_urls(db, rest.values())
+        found.update(canonical for canonical, raw in rest.items() if raw in found_raw)
+
+    return found
 
 
 def save_articles(db, articles: list, source_name: str) -> int:
-    """Save articles to DB with deduplication and AI enrichment"""
+    """Save raw articles to DB with deduplication, queued for AI enrichment"""
+    start = time.perf_counter()
 
     source = db.query(Source).filter(Source.name == source_name).first()
     if not source:
         logger.warning(f"Source not found: {source_name}")
         return 0
 
-    processor = Processor()
-    saved = 0
-
+    # -------------------------
+    # Deduplication on canonical URLs (batch + Bloom filter + DB)
+    # -------------------------
+    candidates = {}
     for item in articles:
-        if not item.get("url"):
-            continue
+        url = canonicalize_url(item.get("url"))
+        if url and url not in candidates:
+            candidates[url] = item
 
-        # Deduplication
-        exists = db.query(Article).filter(Article.url == item["url"]).first()
-        if exists:
-            continue
+    known = known_urls(db, {url: item["url"] for url, item in candidates.items()})
+    new_items = [(url, item) for url, item in candidates.items() if url not in known]
+    ARTICLES_KNOWN.inc(len(known), source=source_name)
+
+    if not new_items:
+        SAVE_ARTICLES_SECONDS.observe(time.perf_counter() - start, source=source_name)
+        return 0
+
+    # -------------------------
+    # Save raw articles; AI enrichment happens in EnrichmentWorker
+    # -------------------------
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": item.get("title", "No title"),
+            "url": item["url"].strip(),
+            "canonical_url": url,
+            "content_md": item.get("content", ""),
+            "content_text": normalize_content(item.get("content", "")),
+            "takeaways": [],
+            "published_at": item.get("published_at") or datetime.utcnow(),
+            "source_id": source.id,
+            "created_at": datetime.utcnow(),
+            "enrichment_status": "pending",
+            "enrichment_attempts": 0,
+        }
+        for url, item in new_items
+    ]
 
-        content = item.get("content", "")
-
-        # -------------------------
-        # AI PROCESSING (SAFE)
-        # -------------------------
-        try:
-            ai_data = processor.process_article(content)
-        except Exception as e:
-            logger.error(f"AI processing failed: {e}")
-            ai_data = {
-                "summary": "",
-                "takeaways": [],
-                "topic": "General",
-            }
-
-        # -------------------------
-        # Save article
-        # -------------------------
-        article = Article(
-            title=item.get("title", "No title"),
-            url=item["url"],
-            content_md=content,
-            summary=ai_data.get("summary"),
-            takeaways=ai_data.get("takeaways", []),
-            topic=ai_data.get("topic", "General"),
-            published_at=item.get("published_at") or datetime.utcnow(),
-            source_id=source.id,
-            created_at=datetime.utcnow(),
-        )
-
-        db.add(article)
-        saved += 1
+    duplicates = _cluster_near_duplicates(db, rows)
 
+    saved = _insert_articles(db, rows)
     db.commit()
-    return saved
\ No newline at end of file
+
+    get_seen_urls().add_many(row["canonical_url"] for row in rows)
+
+    elapsed = time.perf_counter() - start
+    SAVE_ARTICLES_SECONDS.observe(elapsed, source=source_name)
+    SAVE_ARTICLES_ROWS_PER_SECOND.set(saved / elapsed, source=source_name)
+    ARTICLES_SAVED.inc(saved, source=source_name)
+    ARTICLES_NEAR_DUPLICATE.inc(duplicates, source=source_name)
+    return saved
+
+
+def _cluster_near_duplicates(db, rows: list[dict]) -> int:
+    """
+    The same story arrives from several outlets under different URLs.
+    Match each new row's MinHash signature against the recent window (and
+    the rows before it in this batch): a near-duplicate joins the earlier
+    article's cluster and is saved as 'duplicate', so only the cluster's
+    first article is sent for enrichment. Returns the number clustered.
+    """
+    since = datetime.utcnow() - timedelta(days=NEAR_DUP_WINDOW_DAYS)
+    index = NearDuplicateIndex.load(db, since)
+    duplicates = 0
+
+    for row in rows:
+        row["cluster_id"] = row["id"]
+        row["minhash"] = None
+
+        # Too short to fingerprint (a bare title, "Comments"): left unclustered
+        sig = signature(row["content_text"])
+        if sig is None:
+            continue
+
+        cluster_id = index.match(sig)
+        if cluster_id is not None:
+            row["cluster_id"] = cluster_id
+            row["enrichment_status"] = "duplicate"
+            duplicates += 1
+
+        row["minhash"] = sig.tobytes()
+        index.add(row["id"], row["cluster_id"], sig)
+
+    if duplicates:
+        logger.info(f"Clustered {duplicates} near-duplicate articles (window of {len(index)})")
+
+    return duplicates
+
+
+def _insert_articles(db, rows: list[dict]) -> int:
+    """
+    INSERT ... ON CONFLICT DO NOTHING RETURNING id, executemany-style.
+    SQLAlchemy batches the parameter sets into multi-row VALUES, rows
+    raced in by another writer since the lookup (same url or
+    canonical_url, both unique) are skipped, and
+    RETURNING gives the exact number actually inserted.
+    """
+    table = Article.__table__
+    stmt = (
+        insert(table)
+        .on_conflict_do_nothing()
+        .returning(table.c.id)
+    )
+
+    saved = 0
+    for i in range(0, len(rows), BATCH_SIZE):
+        saved += len(db.execute(stmt, rows[i:i + BATCH_SIZE]).all())
+
+    return saved
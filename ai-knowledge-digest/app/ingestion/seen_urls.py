@@ -0,0 +1,166 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+from sqlalchemy import select
+
+from app.config.logging import logger
+from app.config.settings import URL_BLOOM_PATH, URL_BLOOM_CAPACITY, URL_BLOOM_ERROR_RATE
+from app.database.db import SessionLocal
+from app.database.models import Article
+from app.utils.files import atomic_open
+from app.utils.urls import canonicalize_url
+
+# Bump when canonicalize_url's rules change: filters holding keys built
+# under other rules fail the check and are rebuilt
+_MAGIC = b"URLBLM02"
+_HEADER = struct.Struct("<8sQIQ")  # magic, bits, hashes, items added
+_HEADER_SIZE = 32
+
+
+class BloomFilter:
+    """
+    Bloom filter over a memory-mapped file: the bit array lives in the
+    page cache, survives restarts and is never loaded into the heap.
+    Bit positions use double hashing over one blake2b digest.
+    Lookups take no lock; adds do (read-modify-write of a byte).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._lock = threading.Lock()
+
+        magic, self.bits, self.hashes, self.count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a current URL Bloom filter")
+
+    @staticmethod
+    def create(path: str, capacity: int, error_rate: float):
+        """Write an empty filter sized for `capacity` items at `error_rate`."""
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hashes = max(1, round(bits / capacity * math.log(2)))
+
+        # Never a half-sized file; truncate() keeps the bit array sparse
+        with atomic_open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, bits, hashes, 0).ljust(_HEADER_SIZE, b"\0"))
+            f.truncate(_HEADER_SIZE + (bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def __contains__(self, key: str) -> bool:
+        mm = self._mm
+        return all(
+            mm[_HEADER_SIZE + (pos >> 3)] & (1 << (pos & 7))
+            for pos in self._positions(key)
+        )
+
+    def add_many(self, keys):
+        mm = self._mm
+
+        with self._lock:
+            for key in keys:
+                for pos in self._positions(key):
+                    offset = _HEADER_SIZE + (pos >> 3)
+                    mm[offset] |= 1 << (pos & 7)
+                self.count += 1
+
+            _HEADER.pack_into(mm, 0, _MAGIC, self.bits, self.hashes, self.count)
+
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+
+class SeenUrls:
+    """
+    Every canonical article URL ever ingested, as a persistent Bloom
+    filter. A miss means the URL is new without touching the database;
+    only hits (stored URLs plus ~URL_BLOOM_ERROR_RATE false positives)
+    need confirming with a query. Built from articles.url on first use.
+    """
+
+    def __init__(
+        self,
+        path: str = URL_BLOOM_PATH,
+        capacity: int = URL_BLOOM_CAPACITY,
+        error_rate: float = URL_BLOOM_ERROR_RATE,
+    ):
+        self.capacity = capacity
+
+        if os.path.exists(path):
+            try:
+                self.bloom = BloomFilter(path)
+                return
+            except ValueError as e:
+                logger.warning(f"{e}, rebuilding it")
+
+        self._bootstrap(path, capacity, error_rate)
+        self.bloom = BloomFilter(path)
+
+    def __contains__(self, canonical_url: str) -> bool:
+        return canonical_url in self.bloom
+
+    def add_many(self, canonical_urls):
+        self.bloom.add_many(canonical_urls)
+        self.bloom.flush()
+
+        if self.bloom.count > self.capacity:
+            logger.warning(
+                f"URL Bloom filter holds {self.bloom.count} URLs, over its capacity "
+                f"of {self.capacity}; delete {self.bloom.path} to rebuild it larger"
+            )
+
+    @staticmethod
+    def _bootstrap(path: str, capacity: int, error_rate: float):
+        start = time.perf_counter()
+        tmp_path = f"{path}.building"
+        BloomFilter.create(tmp_path, capacity, error_rate)
+
+        bloom = BloomFilter(tmp_path)
+        db = SessionLocal()
+        added = 0
+
+        try:
+            result = db.execute(select(Article.url).execution_options(yield_per=10000))
+            for urls in result.scalars().partitions():
+                bloom.add_many(filter(None, map(canonicalize_url, urls)))
+                added += len(urls)
+
+            bloom.flush()
+
+        finally:
+            db.close()
+            bloom.close()
+
+        os.replace(tmp_path, path)
+        logger.info(
+            f"Built URL Bloom filter from {added} articles "
+            f"in {time.perf_counter() - start:.1f} s"
+        )
+
+
+_seen_urls = None
+_seen_urls_lock = threading.Lock()
+
+
+def get_seen_urls() -> SeenUrls:
+    """Process-wide SeenUrls, opened (or built) on first use."""
+    global _seen_urls
+
+    with _seen_urls_lock:
+        if _seen_urls is None:
+            _seen_urls = SeenUrls()
+        return _seen_urls
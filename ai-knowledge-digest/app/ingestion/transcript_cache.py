@@ -0,0 +1,46 @@
+import os
+import re
+from typing import Optional
+
+from app.config.settings import TRANSCRIPT_CACHE_DIR
+from app.config.logging import logger
+from app.utils.files import atomic_write_text
+
+VIDEO_ID = re.compile(r"[A-Za-z0-9_-]+")
+
+
+class TranscriptCache:
+    """
+    Persistent transcript cache, one text file per YouTube video_id.
+    A transcript never changes once published, so entries never expire.
+    """
+
+    def __init__(self, directory: str = TRANSCRIPT_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, video_id: str) -> Optional[str]:
+        if not VIDEO_ID.fullmatch(video_id or ""):
+            return None
+        return os.path.join(self.directory, f"{video_id}.txt")
+
+    def get(self, video_id: str) -> Optional[str]:
+        path = self._path(video_id)
+        if path is None:
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable transcript cache for {video_id}: {e}")
+            return None
+
+    def put(self, video_id: str, text: str):
+        path = self._path(video_id)
+        if path is None:
+            return
+
+        atomic_write_text(path, text)
@@ -1,13 +1,42 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import feedparser
+from typing import Callable
+
+import requests
 from youtube_transcript_api import YouTubeTranscriptApi
+
 from app.config.logging import logger
+from app.config.settings import YOUTUBE_TRANSCRIPT_WORKERS
+from app.database.db import SessionLocal
+from app.ingestion.fetcher import FeedFetcher
+from app.ingestion.persist import known_urls
+from app.ingestion.transcript_cache import TranscriptCache
+from app.utils.urls import canonicalize_url
+
+
+def stored_urls(urls: list[str]) -> set:
+    """
+    The urls already ingested: Bloom filter first, hits confirmed on its
+    own session (scrapers run off the cron thread).
+    """
+    canonical = {canonicalize_url(url): url for url in urls}
+    canonical.pop(None, None)
+
+    db = SessionLocal()
+    try:
+        known = known_urls(db, canonical)
+    finally:
+        db.close()
+
+    return {url for url in urls if canonicalize_url(url) in known}
 
 
 class YouTubeScraper:
     """
     Scrapes recent YouTube videos by channel ID.
-    Pulls transcripts when available.
+    Pulls transcripts when available - only for videos not stored yet,
+    on a bounded thread pool, through an on-disk cache by video_id.
     """
 
     SOURCE_NAME = "YouTube"  
@@ -37,45 +66,140 @@ class YouTubeScraper:
 
     MAX_VIDEOS = 3
 
+    def __init__(
+        self,
+        fetcher: FeedFetcher = None,
+        cache: TranscriptCache = None,
+        known_urls: Callable[[list[str]], set] = stored_urls,
+        workers: int = YOUTUBE_TRANSCRIPT_WORKERS,
+    ):
+        self.fetcher = fetcher or FeedFetcher()
+        self.cache = cache or TranscriptCache()
+        self.known_urls = known_urls
+        self.workers = workers
+
+        # youtube-transcript-api is not thread-safe and edits its session's
+        # headers: one client + session per transcript thread, never the
+        # fetcher's shared session
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    @staticmethod
+    def _feed_url(channel: dict) -> str:
+        return (
+            "https://www.youtube.com/feeds/videos.xml"
+            f"?channel_id={channel['channel_id']}"
+        )
+
     def scrape(self):
-        articles = []
+        entries = []  # (channel, feed entry)
+        feeds = self.fetcher.fetch_all([self._feed_url(c) for c in self.CHANNELS])
 
         for channel in self.CHANNELS:
             try:
-                feed_url = (
-                    "https://www.youtube.com/feeds/videos.xml"
-                    f"?channel_id={channel['channel_id']}"
-                )
+                feed = feeds[self._feed_url(channel)]
+                if isinstance(feed, Exception):
+                    raise feed
 
-                feed = feedparser.parse(feed_url)
-
-                for entry in feed.entries[: self.MAX_VIDEOS]:
-                    video_id = entry.get("yt_videoid")
-
-                    text = ""
-                    try:
-                        if video_id:
-                            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-                            text = " ".join(chunk["text"] for chunk in transcript)
-                    except Exception:
-                        text = entry.get("summary", "")
-
-                    articles.append(
-                        {
-                            "title": entry.get("title", "No title"),
-                            "url": entry.get("link"),
-                            "content": text,
-                            "published_at": datetime.utcnow(), 
-                            "source": self.SOURCE_NAME,      
-                            "channel_name": channel["channel_name"],
-                            "topic_hint": channel["topic_hint"],
-                        }
-                    )
+                entries.extend(
+                    (channel, entry)
+                    for entry in feed.entries[: self.MAX_VIDEOS]
+                    if entry.get("link")
+                )
 
             except Exception as e:
                 logger.warning(
                     f"YouTube channel error ({channel['channel_name']}): {e}"
                 )
 
-        logger.info(f"Scraped {len(articles)} articles from YouTube")
-        return articles
\ No newline at end of file
+        # Dedup first: transcripts are only fetched for videos not stored yet
+        try:
+            known = self.known_urls([entry["link"] for _, entry in entries])
+        except Exception as e:
+            logger.warning(f"Could not check stored YouTube URLs, fetching all: {e}")
+            known = set()
+
+        new_entries = [(c, entry) for c, entry in entries if entry["link"] not in known]
+
+        texts = []
+        if new_entries:
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="transcript"
+                ) as pool:
+                    texts = list(pool.map(self._content, (entry for _, entry in new_entries)))
+            finally:
+                self._close_sessions()
+
+        articles = [
+            {
+                "title": entry.get("title", "No title"),
+                "url": entry["link"],
+                "content": text,
+                "published_at": datetime.utcnow(),
+                "source": self.SOURCE_NAME,
+                "channel_name": channel["channel_name"],
+                "topic_hint": channel["topic_hint"],
+            }
+            for (channel, entry), text in zip(new_entries, texts)
+        ]
+
+        logger.info(
+            f"Scraped {len(articles)} new videos from YouTube "
+            f"({len(entries) - len(new_entries)} already stored)"
+        )
+        return articles
+
+    # --------------------------------------------------
+    # Transcripts
+    # --------------------------------------------------
+    def _content(self, entry) -> str:
+        """The video's transcript (cached by video_id), else the feed summary."""
+        video_id = entry.get("yt_videoid")
+        if not video_id:
+            return entry.get("summary", "")
+
+        text = self.cache.get(video_id)
+        if text is not None:
+            return text
+
+        try:
+            text = self._download_transcript(video_id)
+        except Exception:
+            return entry.get("summary", "")
+
+        try:
+            self.cache.put(video_id, text)
+        except OSError as e:
+            logger.warning(f"Could not cache transcript for {video_id}: {e}")
+
+        return text
+
+    def _download_transcript(self, video_id: str) -> str:
+        if hasattr(YouTubeTranscriptApi, "get_transcript"):  # youtube-transcript-api < 1.0
+            chunks = YouTubeTranscriptApi.get_transcript(video_id)
+            return " ".join(chunk["text"] for chunk in chunks)
+
+        return " ".join(snippet.text for snippet in self._transcript_api().fetch(video_id))
+
+    def _transcript_api(self) -> YouTubeTranscriptApi:
+        """This thread's client, on a keep-alive session of its own."""
+        api = getattr(self._local, "api", None)
+        if api is None:
+            session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+
+            api = self._local.api = YouTubeTranscriptApi(http_client=session)
+
+        return api
+
+    def _close_sessions(self):
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+
+        for session in sessions:
+            session.close()
+
+        self._local = threading.local()
@@ -0,0 +1,84 @@
+from collections import deque
+from typing import Iterable
+
+
+class InterestMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of interest terms.
+    Compiled once per run; scan() walks a text exactly once and
+    reports every term that occurs in it, however many terms there are.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = sorted({t.lower() for t in terms if t})
+        self._known = frozenset(self.terms)
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+
+        for term in self.terms:
+            self._add(term)
+
+        self._link()
+
+    # --------------------------------------------------
+    # BUILD
+    # --------------------------------------------------
+    def _add(self, term: str):
+        state = 0
+
+        for ch in term:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+
+        self._out[state] = self._out[state] + (term,)
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    # --------------------------------------------------
+    # MATCH
+    # --------------------------------------------------
+    def covers(self, terms: Iterable[str]) -> bool:
+        return all(t in self._known for t in terms)
+
+    def scan(self, text: str) -> dict[str, int]:
+        """Return {term: occurrence count} for every term found in text."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+
+        hits: dict[str, int] = {}
+        state = 0
+
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+
+            state = goto[state].get(ch, 0)
+
+            if out[state]:
+                for term in out[state]:
+                    hits[term] = hits.get(term, 0) + 1
+
+        return hits
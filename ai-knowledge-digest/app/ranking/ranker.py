@@ -1,24 +1,114 @@
 
 from app.database.models import Article, User
 from app.config.logging import logger
+from app.config.settings import RANKING_ENGINE
+from app.ranking.matcher import InterestMatcher
 
 
 class ArticleRanker:
+    def __init__(self):
+        self._matcher = None
+        self._bits: dict[str, int] = {}
+        self._masks: dict[int, int] = {}
+        self._pool: list[Article] = []
+
+    # --------------------------------------------------
+    # PER-RUN PREPARATION
+    # --------------------------------------------------
+    def prepare(self, articles: list[Article], users: list[User]):
+        """
+        Compile every user's interests into one matcher and scan each
+        article once into a bitmask of the terms it contains. rank()
+        then scores a user with one AND + popcount per article.
+        """
+        self._matcher = InterestMatcher(
+            interest for user in users for interest in (user.interests or [])
+        )
+        self._bits = {
+            term: 1 << i for i, term in enumerate(self._matcher.terms)
+        }
+        self._masks = {}
+        self._pool = []
+
+        for article in articles:
+            self._index(article)
+
+        logger.info(
+            f"Indexed {len(self._masks)} articles against "
+            f"{len(self._bits)} interest terms"
+        )
+
+    def _index(self, article: Article) -> int:
+        text = f"{article.title or ''} {article.content_text or article.content_md or ''}".lower()
+
+        mask = 0
+        for term in self._matcher.scan(text):
+            mask |= self._bits[term]
+
+        # Keyed by object identity: UUID hashing dominates the hot loop.
+        # The pool list keeps the objects (and so their ids) alive.
+        self._masks[id(article)] = mask
+        self._pool.append(article)
+        return mask
+
+    # --------------------------------------------------
+    # RANK
+    # --------------------------------------------------
     def rank(self, articles: list[Article], user: User) -> list[Article]:
+        interests = [interest.lower() for interest in user.interests]
+
+        if self._matcher is not None and self._matcher.covers(interests):
+            ranked = self._rank_from_masks(articles, interests)
+        else:
+            ranked = self._rank_by_substring(articles, interests)
+
+        logger.info(f"Ranked {len(ranked)} articles for user {user.email}")
+
+        return ranked
+
+    def _rank_from_masks(self, articles: list[Article], interests: list[str]) -> list[Article]:
+        masks = self._masks
+        for article in articles:
+            if id(article) not in masks:
+                self._index(article)
+
+        bits = [self._bits[interest] for interest in interests]
+
+        if len(set(bits)) == len(bits):
+            user_mask = sum(bits)
+            scores = [(masks[id(a)] & user_mask).bit_count() for a in articles]
+        else:
+            # Repeated interests count once per repetition, as before
+            scores = [sum(1 for b in bits if masks[id(a)] & b) for a in articles]
+
+        # Same order as the substring path: score desc, stable on ties
+        order = sorted(range(len(articles)), key=scores.__getitem__, reverse=True)
+
+        return [articles[i] for i in order]
+
+    @staticmethod
+    def _rank_by_substring(articles: list[Article], interests: list[str]) -> list[Article]:
         ranked = []
 
         for article in articles:
             score = 0
-            text = f"{article.title or ''} {article.content_md or ''}".lower()
+            text = f"{article.title or ''} {article.content_text or article.content_md or ''}".lower()
 
-            for interest in user.interests:
-                if interest.lower() in text:
+            for interest in interests:
+                if interest in text:
                     score += 1
 
             ranked.append((score, article))
 
         ranked.sort(key=lambda x: x[0], reverse=True)
 
-        logger.info(f"Ranked {len(ranked)} articles for user {user.email}")
+        return [article for _, article in ranked]
+
+
+def get_ranker():
+    """Ranking engine selected by RANKING_ENGINE."""
+    if RANKING_ENGINE == "bm25":
+        from app.ranking.bm25 import BM25Ranker  # lazy: needs numpy/scipy
+        return BM25Ranker()
 
-        return [article for _, article in ranked]
\ No newline at end of file
+    return ArticleRanker()
@@ -1,19 +1,32 @@
 import schedule
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from app.config.settings import DIGEST_GENERATION_TIME
+from sqlalchemy import exists, func
+from sqlalchemy.orm import joinedload
+
+from app.config.settings import DIGEST_GENERATION_TIME, METRICS_PORT, METRICS_TEXTFILE
 from app.config.logging import logger
+from app.config.metrics import (
+    ENRICHMENT_QUEUE_DEPTH,
+    LAST_SUCCESS,
+    OUTBOX_DEPTH,
+    STAGE_SECONDS,
+    registry,
+)
 from app.database.db import SessionLocal
 
+from app.ingestion.fetcher import FeedFetcher
 from app.ingestion.blog_scraper import BlogScraper
 from app.ingestion.youtube_scraper import YouTubeScraper
 from app.ingestion.newsletter_scraper import NewsletterScraper
 from app.ingestion.persist import save_articles
 
 from app.ai.processor import Processor
+from app.ai.enrichment import EnrichmentWorker
 from app.digest.generator import Generator
-from app.email.sender import EmailSender
+from app.email.outbox import OutboxDispatcher, enqueue
 from app.digest.templates import Templates
 
 
@@ -24,7 +37,6 @@ class Cron:
         self.db = SessionLocal()
         self.processor = Processor()
         self.generator = Generator(self.db, self.processor)
-        self.email_sender = EmailSender()
 
     # --------------------------------------------------
     # Scheduling
@@ -45,84 +57,141 @@ class Cron:
 
             # Step 1: Scrape + persist
             logger.info("Step 1: Scraping content from sources...")
-            self._scrape_and_store_sources()
+            with STAGE_SECONDS.time(stage="scrape"):
+                self._scrape_and_store_sources()
+
+            # Step 1b: AI enrichment of newly saved articles
+            logger.info("Step 1b: Enriching pending articles...")
+            with STAGE_SECONDS.time(stage="enrich"):
+                enriched = EnrichmentWorker().run()
+            logger.info(f"Enriched {enriched} articles")
 
             # Step 2: Generate digests
             logger.info("Step 2: Generating digests...")
-            digest_count = self.generator.generate_for_all_users(self.db)
+            with STAGE_SECONDS.time(stage="generate"):
+                digest_count = self.generator.generate_for_all_users(self.db)
             logger.info(f"Generated {digest_count} digests")
 
             # Step 3: Send emails
             logger.info("Step 3: Sending digest emails...")
-            email_count = self._send_digest_emails()
+            with STAGE_SECONDS.time(stage="email"):
+                email_count = self._send_digest_emails()
             logger.info(f"Sent {email_count} digest emails")
 
+            LAST_SUCCESS.set(time.time())
             logger.info("Daily job completed successfully")
 
         except Exception as e:
             logger.error(f"Error in daily job: {str(e)}")
 
+        finally:
+            self._export_metrics()
+
     # --------------------------------------------------
-    # Scrape + Persist
+    # Metrics
     # --------------------------------------------------
-    def _scrape_and_store_sources(self):
-        try:
-            blog_articles = BlogScraper().scrape()
-            saved = save_articles(self.db, blog_articles, "Blog")
-            logger.info(f"Saved {saved} blog articles")
-        except Exception as e:
-            logger.error(f"Error scraping blogs: {str(e)}")
+    def _export_metrics(self):
+        """Refresh the queue-depth gauges and write the textfile, if configured."""
+        from app.database.models import Article, EmailOutbox
 
         try:
-            yt_articles = YouTubeScraper().scrape()
-            saved = save_articles(self.db, yt_articles, "YouTube")
-            logger.info(f"Saved {saved} YouTube articles")
-        except Exception as e:
-            logger.error(f"Error scraping YouTube: {str(e)}")
+            self.db.rollback()  # a failed step may have left the session aborted
+
+            for gauge, column in (
+                (ENRICHMENT_QUEUE_DEPTH, Article.enrichment_status),
+                (OUTBOX_DEPTH, EmailOutbox.status),
+            ):
+                counts = self.db.query(column, func.count()).group_by(column).all()
+                gauge.clear()  # statuses that drained to zero rows
+                for status, count in counts:
+                    gauge.set(count, status=status)
+
+            if METRICS_TEXTFILE:
+                registry.write_textfile(METRICS_TEXTFILE)
 
-        try:
-            nl_articles = NewsletterScraper().scrape()
-            saved = save_articles(self.db, nl_articles, "Newsletter")
-            logger.info(f"Saved {saved} newsletter articles")
         except Exception as e:
-            logger.error(f"Error scraping newsletters: {str(e)}")
+            logger.error(f"Error exporting metrics: {str(e)}")
 
     # --------------------------------------------------
-    # Email Sending  ✅ FIXED
+    # Scrape + Persist
+    # --------------------------------------------------
+    def _scrape_and_store_sources(self):
+        # Scrapers share one fetcher and run concurrently; persisting stays
+        # sequential because the DB session is not thread-safe.
+        with FeedFetcher() as fetcher, ThreadPoolExecutor(max_workers=3) as pool:
+            blog_future = pool.submit(BlogScraper(fetcher).scrape)
+            yt_future = pool.submit(YouTubeScraper(fetcher).scrape)
+            nl_future = pool.submit(NewsletterScraper(fetcher).scrape)
+
+            try:
+                blog_articles = blog_future.result()
+                saved = save_articles(self.db, blog_articles, "Blog")
+                logger.info(f"Saved {saved} blog articles")
+            except Exception as e:
+                logger.error(f"Error scraping blogs: {str(e)}")
+
+            try:
+                yt_articles = yt_future.result()
+                saved = save_articles(self.db, yt_articles, "YouTube")
+                logger.info(f"Saved {saved} YouTube articles")
+            except Exception as e:
+                logger.error(f"Error scraping YouTube: {str(e)}")
+
+            try:
+                nl_articles = nl_future.result()
+                saved = save_articles(self.db, nl_articles, "Newsletter")
+                logger.info(f"Saved {saved} newsletter articles")
+            except Exception as e:
+                logger.error(f"Error scraping newsletters: {str(e)}")
+
+    # --------------------------------------------------
+    # Email Sending (outbox)
     # --------------------------------------------------
     def _send_digest_emails(self) -> int:
-        from app.database.models import Digest, Article
+        self._enqueue_digest_emails()
+        return OutboxDispatcher().run()
+
+    def _enqueue_digest_emails(self) -> int:
+        """Render today's unsent digests into the outbox (once per digest)."""
+        from app.database.models import Digest, Article, EmailOutbox
 
         today = datetime.utcnow().date()
 
+        # Users eager-loaded in the same query
         digests = (
             self.db.query(Digest)
+            .options(joinedload(Digest.user))
             .filter(
                 Digest.generated_date == today,
-                Digest.email_sent == False
+                Digest.email_sent == False,
+                ~exists().where(EmailOutbox.digest_id == Digest.id),
             )
             .all()
         )
 
-        sent_count = 0
+        # Every referenced article in one query: id → render dict
+        article_ids = {aid for digest in digests for aid in digest.article_ids or []}
+        articles_by_id = {}
+
+        if article_ids:
+            for a in self.db.query(Article).filter(Article.id.in_(article_ids)):
+                articles_by_id[a.id] = {
+                    "id": a.id,
+                    "title": a.title,
+                    "url": a.url,
+                    "summary": a.summary or "",
+                    "topic": a.topic or "General",
+                    "takeaways": a.takeaways or [],
+                }
+
+        messages = []
 
         for digest in digests:
             try:
-                articles = (
-                    self.db.query(Article)
-                    .filter(Article.id.in_(digest.article_ids))
-                    .all()
-                )
-
                 articles_data = [
-                    {
-                        "title": a.title,
-                        "url": a.url,
-                        "summary": a.summary or "",
-                        "topic": a.topic or "General",
-                        "takeaways": a.takeaways or [],
-                    }
-                    for a in articles
+                    articles_by_id[aid]
+                    for aid in digest.article_ids or []
+                    if aid in articles_by_id
                 ]
 
                 html_body = Templates.get_email_template(
@@ -130,26 +199,30 @@ class Cron:
                     articles_data,
                 )
 
-                # 🔥 SEND EMAIL (no if-condition bullshit)
-                self.email_sender.send_email(
-                    recipient=digest.user.email,
-                    subject="Your Daily AI Digest 🚀",
-                    body=html_body,
+                messages.append(
+                    {
+                        "digest_id": digest.id,
+                        "recipient": digest.user.email,
+                        "subject": "Your Daily AI Digest 🚀",
+                        "body": html_body,
+                    }
                 )
 
-                digest.email_sent = True
-                self.db.commit()
-                sent_count += 1
-
             except Exception as e:
-                logger.error(f"Error sending digest email: {str(e)}")
+                logger.error(f"Error rendering digest email: {str(e)}")
 
-        return sent_count
+        queued = enqueue(self.db, messages)
+        self.db.commit()
+        logger.info(f"Queued {queued} digest emails")
+        return queued
 
     # --------------------------------------------------
     # Scheduler Runner
     # --------------------------------------------------
     def run_scheduler(self):
+        if METRICS_PORT:
+            registry.serve(METRICS_PORT)
+
         self.schedule_jobs()
 
         logger.info("DEV MODE: Running daily job immediately")
@@ -0,0 +1,35 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = "wb", encoding: str = None):
+    """
+    Open a temporary file next to `path`; on a clean exit it is fsynced
+    and renamed over `path`, on an exception it is removed. Readers see
+    the old file or the new one, never a truncated one.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    with atomic_open(path, "wb") as f:
+        f.write(data)
+
+
+def atomic_write_text(path: str, text: str):
+    with atomic_open(path, "w", encoding="utf-8") as f:
+        f.write(text)
@@ -1,23 +1,129 @@
+import re
+from functools import lru_cache
+from types import MappingProxyType
 
-# Canonical topics used across the system
+# --------------------------------------------------
+# CANONICAL TOPICS (SINGLE SOURCE OF TRUTH)
+# --------------------------------------------------
+# Article.topic is always one of these keys; user interests and AI/feed
+# topics are mapped onto them through the aliases.
 CANONICAL_TOPICS = {
-    "ai": ["ai", "llm", "llms", "machine learning", "deep learning"],
-    "mlops": ["mlops", "devops", "deployment", "pipelines"],
-    "startup": ["startup", "startups", "founder", "entrepreneurship"],
-    "vc": ["vc", "venture capital", "investment", "funding"],
-    "product": ["product", "pm", "product management", "ux"],
-    "cloud": ["cloud", "aws", "gcp", "azure"],
+    "ai": [
+        "artificial intelligence", "llm", "llms", "chatgpt",
+        "machine learning", "deep learning",
+    ],
+    "mlops": [
+        "devops", "cloud", "infrastructure", "deployment", "pipelines",
+        "aws", "gcp", "azure",
+    ],
+    "startup": ["startups", "business", "founder", "saas", "entrepreneurship"],
+    "product": ["pm", "ux", "design", "product management"],
+    "vc": ["investment", "funding", "venture capital"],
+    "general": [],
 }
 
+DEFAULT_TOPIC = "general"
+
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def _key(text: str) -> str:
+    """Lowercase, with any run of spaces/punctuation collapsed to one space."""
+    return _SEPARATORS.sub(" ", text.lower()).strip()
+
+
+# --------------------------------------------------
+# COMPILED AT IMPORT
+# --------------------------------------------------
+# alias (or canonical name) → canonical
+ALIASES = MappingProxyType(
+    {
+        _key(alias): canonical
+        for canonical, aliases in CANONICAL_TOPICS.items()
+        for alias in (canonical, *aliases)
+    }
+)
+
+# canonical → every term that means it
+EXPANSIONS = MappingProxyType(
+    {
+        canonical: frozenset(_key(alias) for alias in (canonical, *aliases))
+        for canonical, aliases in CANONICAL_TOPICS.items()
+    }
+)
+
+_MAX_PHRASE_WORDS = max(len(alias.split()) for alias in ALIASES)
+
+
+@lru_cache(maxsize=4096)
+def _lookup(text: str):
+    """
+    Canonical topic for `text`: an exact alias hit, otherwise the longest,
+    left-most alias phrase inside it ("deep learning research" → ai).
+    Cached: AI and feed topics repeat a handful of values.
+    """
+    key = _key(text)
+
+    canonical = ALIASES.get(key)
+    if canonical or not key:
+        return canonical
+
+    words = key.split()
+    for size in range(min(_MAX_PHRASE_WORDS, len(words)), 0, -1):
+        for start in range(len(words) - size + 1):
+            canonical = ALIASES.get(" ".join(words[start:start + size]))
+            if canonical:
+                return canonical
+
+    return None
+
+
+# --------------------------------------------------
+# PUBLIC API
+# --------------------------------------------------
+def normalize_topic(raw_topic: str) -> str:
+    """Map an AI / feed topic onto a canonical topic ('general' if unknown)."""
+    if not raw_topic:
+        return DEFAULT_TOPIC
+
+    return _lookup(raw_topic) or DEFAULT_TOPIC
+
 
 def normalize_interest(interest: str) -> str | None:
     """
     Convert user interest into a canonical topic.
+    Exact aliases only: the result replaces the stored interest, which the
+    ranker matches verbatim, so a phrase like "deep learning research" is
+    left alone rather than broadened to "ai".
     """
-    interest = interest.lower().strip()
+    if not interest:
+        return None
+
+    return ALIASES.get(_key(interest))
+
+
+@lru_cache(maxsize=16384)
+def _expand(interests: tuple[str, ...]) -> frozenset[str]:
+    expanded = set()
 
-    for canonical, aliases in CANONICAL_TOPICS.items():
-        if interest == canonical or interest in aliases:
-            return canonical
+    for interest in interests:
+        key = _key(interest)
+        if not key:
+            continue
 
-    return None
\ No newline at end of file
+        expanded.add(key)
+
+        canonical = _lookup(key)
+        if canonical:
+            expanded |= EXPANSIONS[canonical]
+
+    return frozenset(expanded)
+
+
+def expand_interests(interests: list[str]) -> frozenset[str]:
+    """
+    The user's interests plus every alias of the canonical topics they
+    map to. Cached per distinct interest list, so users with the same
+    interests share one expansion.
+    """
+    return _expand(tuple(interests or ()))
@@ -0,0 +1,57 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from (generic
+# names like source/share/feature can select content, so they are kept)
+TRACKING_PARAMS = frozenset(
+    {
+        "ref", "ref_src", "ref_url",
+        "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid",
+        "mc_cid", "mc_eid", "mkt_tok", "_hsenc", "_hsmi",
+        "cmpid", "spm", "sr_share",
+    }
+)
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str | None:
+    """
+    Dedup key for an article URL, so tracking variants match: lowercase
+    scheme and host, no default port, no fragment, no tracking parameters,
+    remaining query sorted, no trailing slash. Only a key: the URL stored
+    and emailed stays as scraped. None for anything that is not http(s).
+    """
+    if not url:
+        return None
+
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    host = parts.hostname.lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    query = ""
+    if parts.query:
+        query = urlencode(
+            sorted(
+                (key, value)
+                for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                if key.lower() not in TRACKING_PARAMS
+                and not key.lower().startswith(TRACKING_PREFIXES)
+            )
+        )
+
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((scheme, host, path, query, ""))
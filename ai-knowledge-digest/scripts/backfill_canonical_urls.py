@@ -0,0 +1,48 @@
+from app.database.maintenance import ChunkedJob, run_from_cli
+from app.database.models import Article
+from app.ingestion.persist import existing_urls
+from app.utils.urls import canonicalize_url
+
+
+class BackfillCanonicalUrls(ChunkedJob):
+    """Fill Article.canonical_url for rows saved before it existed, in chunks."""
+
+    name = "backfill_canonical_urls"
+    model = Article
+    columns = (Article.url, Article.canonical_url)
+
+    def transform(self, row):
+        if row.canonical_url is not None:
+            return None
+
+        canonical = canonicalize_url(row.url)
+        if canonical:
+            return {"canonical_url": canonical}
+        return None
+
+    def describe(self, row, values):
+        return f"article {row.id}: {row.url} → {values['canonical_url']}"
+
+    def _scan_chunk(self, db, key, last_key):
+        # canonical_url is unique: an older row already owning the key
+        # (a tracking variant saved twice) keeps it, the later one stays NULL
+        scanned, last_key, changes = super()._scan_chunk(db, key, last_key)
+
+        taken = existing_urls(
+            db, {c["canonical_url"] for c in changes}, column=Article.canonical_url
+        )
+        unique = []
+        for change in changes:
+            if change["canonical_url"] not in taken:
+                taken.add(change["canonical_url"])
+                unique.append(change)
+
+        return scanned, last_key, unique
+
+
+def main():
+    run_from_cli(BackfillCanonicalUrls)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,28 @@
-from app.database.db import SessionLocal
+from app.database.maintenance import ChunkedJob, run_from_cli
 from app.database.models import Article
-from app.config.logging import logger
+from app.utils.topics import normalize_topic
 
 
-def normalize_topic(raw_topic: str) -> str:
-    if not raw_topic:
-        return "general"
+class BackfillTopics(ChunkedJob):
+    """Normalize Article.topic in chunks."""
 
-    raw = raw_topic.lower()
+    name = "backfill_topics"
+    model = Article
+    columns = (Article.topic,)
 
-    if raw in ["llm", "ai", "artificial intelligence", "chatgpt"]:
-        return "llms"
-    if raw in ["mlops", "devops", "cloud", "infrastructure"]:
-        return "mlops"
-    if raw in ["startup", "business", "founder", "saas"]:
-        return "startups"
-    if raw in ["vc", "investment", "funding"]:
-        return "vc"
-    if raw in ["product", "pm", "ux", "design"]:
-        return "product"
+    def transform(self, row):
+        new = normalize_topic(row.topic)
+        if new != row.topic:
+            return {"topic": new}
+        return None
 
-    return "general"
+    def describe(self, row, values):
+        return f"article {row.id}: {row.topic!r} → {values['topic']!r}"
 
 
 def main():
-    db = SessionLocal()
-
-    articles = db.query(Article).all()
-    updated = 0
-
-    for article in articles:
-        old = article.topic
-        new = normalize_topic(article.topic)
-
-        if old != new:
-            article.topic = new
-            db.add(article)
-            updated += 1
-
-    db.commit()
-    db.close()
-
-    logger.info(f"Backfilled topics for {updated} articles")
+    run_from_cli(BackfillTopics)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
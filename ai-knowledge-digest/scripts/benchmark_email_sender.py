@@ -0,0 +1,107 @@
+"""
+Compare EmailSender (connection per message) with PooledEmailSender
+against a local SMTP stub.
+
+    python -m scripts.benchmark_email_sender --messages 500
+
+The stub answers every command after --rtt seconds and delays the
+greeting by --handshake seconds, standing in for the network round
+trips and the STARTTLS/AUTH cost of a real provider (the stub speaks
+plain SMTP, so TLS and login are turned off for both senders).
+"""
+import argparse
+import socketserver
+import threading
+import time
+
+from app.config.logging import logger
+from app.email.sender import EmailSender, PooledEmailSender
+
+
+def make_stub(rtt: float, handshake: float):
+    class SMTPStub(socketserver.StreamRequestHandler):
+        def reply(self, line: str):
+            time.sleep(rtt)
+            self.wfile.write(f"{line}\r\n".encode())
+
+        def handle(self):
+            time.sleep(handshake)
+            self.reply("220 stub ESMTP")
+
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+
+                command = line.decode(errors="replace").strip().upper()
+
+                if command.startswith(("EHLO", "HELO")):
+                    self.reply("250 stub")
+                elif command == "DATA":
+                    self.reply("354 end with .")
+                    while self.rfile.readline() not in (b".\r\n", b""):
+                        pass
+                    self.reply("250 queued")
+                elif command == "QUIT":
+                    self.reply("221 bye")
+                    return
+                else:
+                    self.reply("250 ok")
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPStub)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_messages(n: int) -> list[dict]:
+    return [
+        {
+            "recipient": f"user{i}@example.com",
+            "subject": "Your Daily AI Digest",
+            "body": f"<html><body><p>Digest {i}</p>{'<p>Article</p>' * 20}</body></html>",
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--rtt", type=float, default=0.002)
+    parser.add_argument("--handshake", type=float, default=0.05)
+    args = parser.parse_args()
+
+    logger.setLevel("WARNING")
+
+    server = make_stub(args.rtt, args.handshake)
+    host, port = server.server_address
+    options = dict(host=host, port=port, user=None, use_tls=False, from_email="bench@example.com")
+    messages = make_messages(args.messages)
+
+    try:
+        sender = EmailSender(**options)
+        start = time.perf_counter()
+        for message in messages:
+            sender.send_email(**message)
+        baseline = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with PooledEmailSender(connections=args.connections, **options) as pooled:
+            errors = [error for _, error in pooled.send_many(messages) if error]
+        elapsed = time.perf_counter() - start
+
+        print(f"messages={len(messages)} errors={len(errors)}")
+        print(f"per-message connection: {len(messages) / baseline:,.0f} msg/s ({baseline:.1f} s)")
+        print(
+            f"pooled x{args.connections}:            "
+            f"{len(messages) / elapsed:,.0f} msg/s ({elapsed:.1f} s)"
+        )
+
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Measure digest email render time on synthetic digests.
+
+    python -m scripts.benchmark_email_template --emails 100000
+
+Each email picks 5 of --articles synthetic articles, so popular
+articles repeat across recipients the way they do in a daily run.
+"""
+import argparse
+import random
+import time
+import uuid
+
+from app.digest.templates import Templates, fragment_cache
+
+WORDS = "model agents inference latency cluster gpu retrieval & <eval> benchmark open weights".split()
+
+
+def make_articles(n: int) -> list[dict]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "title": " ".join(random.choices(WORDS, k=10)),
+            "url": f"https://bench.example.com/{i}",
+            "summary": " ".join(random.choices(WORDS, k=40)),
+            "topic": "ai",
+            "takeaways": [],
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--emails", type=int, default=100000)
+    parser.add_argument("--articles", type=int, default=2000)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    digests = [random.sample(articles, 5) for _ in range(args.emails)]
+    overview = "Good morning! Today's digest features " + " ".join(random.choices(WORDS, k=50))
+
+    start = time.perf_counter()
+    for digest in digests:
+        Templates.get_email_template(overview, digest)
+    elapsed = time.perf_counter() - start
+
+    lookups = fragment_cache.hits + fragment_cache.misses
+    print(f"emails={args.emails} in {elapsed:.2f} s, {elapsed / args.emails * 1e6:.1f} us/email")
+    print(f"fragment cache hit rate {fragment_cache.hits / lookups:.1%}")
+
+
+if __name__ == "__main__":
+    main()
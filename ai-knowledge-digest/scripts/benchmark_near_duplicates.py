@@ -0,0 +1,90 @@
+"""
+Measure near-duplicate clustering on a synthetic ingestion window.
+
+    python -m scripts.benchmark_near_duplicates --stories 2000 --copies 4
+
+Each story is syndicated as --copies extra articles with --edit of its
+words substituted and outlet boilerplate added, mixed with as many
+unrelated articles. Reports signature/match time, how many copies
+were clustered with their story (recall), how many unrelated articles
+were wrongly clustered, and the enrichment calls saved.
+"""
+import argparse
+import random
+import time
+import uuid
+
+from app.ingestion.dedup import NearDuplicateIndex, signature
+
+VOCAB = [f"w{i}" for i in range(20000)]
+OUTLETS = ["The Verge", "Ars Technica", "Hacker News", "TechCrunch", "Weekly AI Newsletter"]
+
+
+def make_story(words: int) -> list[str]:
+    return random.choices(VOCAB, k=words)
+
+
+def make_copy(story: list[str], edit: float) -> list[str]:
+    copy = [random.choice(VOCAB) if random.random() < edit else w for w in story]
+    outlet = random.choice(OUTLETS)
+    return f"Originally reported by {outlet}".split() + copy + f"Read more at {outlet}".split()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stories", type=int, default=2000)
+    parser.add_argument("--copies", type=int, default=4)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--edit", type=float, default=0.05)
+    args = parser.parse_args()
+
+    random.seed(7)
+    articles = []  # (story key or None, text)
+
+    for s in range(args.stories):
+        story = make_story(args.words)
+        articles.append((s, " ".join(story)))
+        for _ in range(args.copies):
+            articles.append((s, " ".join(make_copy(story, args.edit))))
+
+    for _ in range(args.stories):
+        articles.append((None, " ".join(make_story(args.words))))
+
+    random.shuffle(articles)
+
+    start = time.perf_counter()
+    signatures = [signature(text) for _, text in articles]
+    sig_time = time.perf_counter() - start
+
+    index = NearDuplicateIndex()
+    cluster_story = {}  # cluster_id → story key of its first article
+    clustered = wrong = representatives = 0
+
+    start = time.perf_counter()
+    for (story, _), sig in zip(articles, signatures):
+        article_id = uuid.uuid4()
+        cluster_id = index.match(sig)
+
+        if cluster_id is None:
+            cluster_id = article_id
+            cluster_story[cluster_id] = story
+            representatives += 1
+        elif story is not None and cluster_story[cluster_id] == story:
+            clustered += 1
+        else:
+            wrong += 1
+
+        index.add(article_id, cluster_id, sig)
+    match_time = time.perf_counter() - start
+
+    copies = args.stories * args.copies
+    print(f"articles={len(articles)} ({args.stories} stories x {args.copies + 1}, {args.stories} unrelated)")
+    print(f"signature {sig_time / len(articles) * 1e6:.0f} us/article, "
+          f"LSH match+add {match_time / len(articles) * 1e6:.0f} us/article")
+    print(f"copies clustered {clustered}/{copies} ({clustered / copies:.1%}), wrongly clustered {wrong}")
+    print(f"enrichment calls {len(articles)} → {representatives} "
+          f"({1 - representatives / len(articles):.1%} saved)")
+
+
+if __name__ == "__main__":
+    main()
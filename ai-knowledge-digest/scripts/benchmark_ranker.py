@@ -0,0 +1,105 @@
+"""
+Compare the per-user substring ranker with the shared interest matcher.
+
+    python -m scripts.benchmark_ranker --articles 10000 --users 10000
+
+The substring path is timed on a sample of users and extrapolated,
+since running it for the full user base takes hours.
+"""
+import argparse
+import random
+import time
+import uuid
+from types import SimpleNamespace
+
+from app.config.logging import logger
+from app.ranking.ranker import ArticleRanker
+
+VOCABULARY = [
+    "llm", "llms", "mlops", "startup", "startups", "vc", "product",
+    "cloud", "security", "devtools", "web", "mobile", "data", "rust",
+    "python", "kubernetes", "funding", "gpu", "inference", "agents",
+    "open source", "machine learning", "deep learning", "design",
+]
+FILLER = (
+    "the quick brown fox jumps over the lazy dog while engineers ship "
+    "features and argue about architecture in long meetings "
+).split()
+
+
+def make_articles(n: int, words: int) -> list:
+    rng = random.Random(1)
+    articles = []
+
+    for _ in range(n):
+        body = [
+            rng.choice(VOCABULARY) if rng.random() < 0.02 else rng.choice(FILLER)
+            for _ in range(words)
+        ]
+        articles.append(
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                title=" ".join(rng.sample(FILLER, 6)),
+                content_md=" ".join(body),
+                content_text=" ".join(body),
+            )
+        )
+
+    return articles
+
+
+def make_users(n: int) -> list:
+    rng = random.Random(2)
+    return [
+        SimpleNamespace(
+            email=f"user{i}@example.com",
+            interests=rng.sample(VOCABULARY, 3),
+        )
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--sample", type=int, default=20)
+    args = parser.parse_args()
+
+    logger.setLevel("WARNING")
+
+    articles = make_articles(args.articles, args.words)
+    users = make_users(args.users)
+    sample = users[: args.sample]
+
+    # Baseline: per-user substring scan
+    baseline = ArticleRanker()
+    start = time.perf_counter()
+    expected = [baseline.rank(articles, u) for u in sample]
+    per_user = (time.perf_counter() - start) / len(sample)
+    baseline_total = per_user * len(users)
+
+    # Matcher: one scan per article, postings lookups per user
+    ranker = ArticleRanker()
+    start = time.perf_counter()
+    ranker.prepare(articles, users)
+    prepare_time = time.perf_counter() - start
+
+    got = [ranker.rank(articles, u) for u in sample]
+    assert [[a.id for a in r] for r in got] == [[a.id for a in r] for r in expected]
+
+    start = time.perf_counter()
+    for u in users:
+        ranker.rank(articles, u)
+    rank_time = time.perf_counter() - start
+    matcher_total = prepare_time + rank_time
+
+    print(f"articles={len(articles)} users={len(users)} words/article={args.words}")
+    print(f"substring: {per_user * 1000:.1f} ms/user -> {baseline_total:.1f} s (extrapolated)")
+    print(f"matcher:   prepare {prepare_time:.1f} s + rank {rank_time:.1f} s = {matcher_total:.1f} s")
+    print(f"speedup:   {baseline_total / matcher_total:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure save_articles throughput on a synthetic batch.
+
+    python -m scripts.benchmark_save_articles --items 100000
+
+Runs against DATABASE_URL. A tenth of the batch is pre-inserted so the
+dedup path is exercised; every benchmark row is deleted afterwards.
+"""
+import argparse
+import time
+import uuid
+
+from app.config.logging import logger
+from app.database.db import SessionLocal
+from app.database.models import Article
+from app.ingestion.persist import save_articles
+
+
+def make_items(n: int, prefix: str) -> list[dict]:
+    return [
+        {
+            "title": f"Benchmark article {i}",
+            "url": f"https://bench.example.com/{prefix}/{i}",
+            "content": f"Synthetic article {i}. It talks about LLMs and MLOps.",
+            "source": "Blog",
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100000)
+    args = parser.parse_args()
+
+    logger.setLevel("WARNING")
+
+    prefix = uuid.uuid4().hex
+    items = make_items(args.items, prefix)
+    db = SessionLocal()
+
+    try:
+        save_articles(db, items[: args.items // 10], "Blog")
+
+        start = time.perf_counter()
+        saved = save_articles(db, items, "Blog")
+        elapsed = time.perf_counter() - start
+
+        print(f"items={len(items)} saved={saved} in {elapsed:.1f} s")
+        print(f"{len(items) / elapsed:,.0f} items/s, {saved / elapsed:,.0f} rows/s")
+
+    finally:
+        db.query(Article).filter(
+            Article.url.like(f"https://bench.example.com/{prefix}/%")
+        ).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
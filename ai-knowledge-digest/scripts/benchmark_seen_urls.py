@@ -0,0 +1,87 @@
+"""
+Compare URL dedup through the Bloom filter with the plain DB lookup.
+
+    python -m scripts.benchmark_seen_urls --batch 5000 --known 0.05
+
+Builds a URL Bloom filter from articles.url (DATABASE_URL) in a
+temporary file, then checks a scraped batch where a --known fraction
+is already stored (with tracking parameters added) against both
+existing_urls and known_urls. Also measures the false-positive rate on
+URLs that were never stored.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import func, select
+
+from app.config.logging import logger
+from app.database.db import SessionLocal
+from app.database.models import Article
+from app.ingestion.persist import existing_urls, known_urls
+from app.ingestion.seen_urls import SeenUrls
+from app.utils.urls import canonicalize_url
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--known", type=float, default=0.05)
+    parser.add_argument("--probes", type=int, default=100000)
+    args = parser.parse_args()
+
+    logger.setLevel("WARNING")
+    db = SessionLocal()
+    path = os.path.join(tempfile.mkdtemp(), "seen_urls.bloom")
+
+    try:
+        stored = db.scalar(select(func.count()).select_from(Article))
+
+        start = time.perf_counter()
+        seen = SeenUrls(path=path, capacity=max(stored * 2, 1000))
+        build = time.perf_counter() - start
+
+        n_known = int(args.batch * args.known)
+        sample = db.scalars(
+            select(Article.url).order_by(func.random()).limit(n_known)
+        ).all()
+        batch = [f"{url}?utm_source=rss" for url in sample] + [
+            f"https://new.example.com/{uuid.uuid4()}" for _ in range(args.batch - n_known)
+        ]
+        random.shuffle(batch)
+
+        start = time.perf_counter()
+        plain = existing_urls(db, batch)
+        db_time = time.perf_counter() - start
+
+        canonical = {canonicalize_url(url): url for url in batch}
+        start = time.perf_counter()
+        bloom_known = known_urls(db, canonical, seen=seen)
+        bloom_time = time.perf_counter() - start
+
+        hits = sum(1 for url in canonical if url in seen)
+
+        probes = [f"https://never.example.com/{uuid.uuid4()}" for _ in range(args.probes)]
+        start = time.perf_counter()
+        false_positives = sum(1 for url in probes if url in seen)
+        probe_time = time.perf_counter() - start
+
+        print(f"articles={stored}  filter {os.path.getsize(path) / 2**20:.1f} MiB, built in {build:.1f} s")
+        print(f"batch={len(batch)} ({n_known} stored, with tracking params)")
+        print(f"existing_urls: {db_time * 1000:.0f} ms, {len(plain)} found (exact match only)")
+        print(f"known_urls:    {bloom_time * 1000:.0f} ms, {len(bloom_known)} found, "
+              f"{hits} Bloom hits sent to the DB")
+        print(f"Bloom lookup {probe_time / len(probes) * 1e6:.1f} us, "
+              f"false positives {false_positives / len(probes):.2%}")
+
+    finally:
+        db.close()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
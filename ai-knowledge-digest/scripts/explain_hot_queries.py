@@ -0,0 +1,163 @@
+"""
+EXPLAIN the hot queries and check they use index scans.
+
+    python -m scripts.explain_hot_queries --seed-articles 10000000 --seed-users 100000
+    python -m scripts.explain_hot_queries            # against existing data
+
+Runs against DATABASE_URL (migrated to head). --seed-* bulk-insert
+synthetic rows with generate_series (articles published over ~10 years,
+digests for the seeded users) and ANALYZE; --cleanup deletes them.
+Exits non-zero if a query plans a sequential scan of its table.
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import String, cast, exists, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.database.db import engine
+from app.database.models import Article, Digest, EmailOutbox, User
+
+SEED_PREFIX = "https://explain.example.com/"
+SEED_DOMAIN = "@explain.example.com"
+
+
+def seed(conn, articles: int, users: int):
+    start = time.perf_counter()
+
+    if articles:
+        conn.execute(
+            text(
+                """
+                INSERT INTO articles
+                    (id, title, url, topic, published_at, created_at,
+                     enrichment_status, enrichment_attempts)
+                SELECT gen_random_uuid(), 'Explain article ' || g, :prefix || g,
+                       (ARRAY['ai', 'mlops', 'startup', 'product', 'vc'])[g % 5 + 1],
+                       now() - (g % 3650) * interval '1 day',
+                       now() - (g % 3650) * interval '1 day',
+                       'done', 0
+                FROM generate_series(1, :n) AS g
+                """
+            ),
+            {"prefix": SEED_PREFIX, "n": articles},
+        )
+
+    if users:
+        conn.execute(
+            text(
+                """
+                INSERT INTO users (id, email, interests, created_at)
+                SELECT gen_random_uuid(), 'explain' || g || :domain,
+                       ARRAY['topic' || (g % 1000), 'ai'], now()
+                FROM generate_series(1, :n) AS g
+                """
+            ),
+            {"domain": SEED_DOMAIN, "n": users},
+        )
+        # 30 days of digests per seeded user, today's still unsent
+        conn.execute(
+            text(
+                """
+                INSERT INTO digests (id, user_id, generated_date, overview, email_sent)
+                SELECT gen_random_uuid(), u.id, current_date - d, 'explain', d > 0
+                FROM users u, generate_series(0, 29) AS d
+                WHERE u.email LIKE :pattern
+                """
+            ),
+            {"pattern": f"%{SEED_DOMAIN}"},
+        )
+
+    for table in ("articles", "users", "digests", "email_outbox"):
+        conn.execute(text(f"ANALYZE {table}"))
+
+    print(f"Seeded {articles} articles, {users} users in {time.perf_counter() - start:.1f} s")
+
+
+def cleanup(conn):
+    conn.execute(
+        text(
+            "DELETE FROM digests WHERE user_id IN "
+            "(SELECT id FROM users WHERE email LIKE :pattern)"
+        ),
+        {"pattern": f"%{SEED_DOMAIN}"},
+    )
+    conn.execute(text("DELETE FROM users WHERE email LIKE :pattern"), {"pattern": f"%{SEED_DOMAIN}"})
+    conn.execute(text("DELETE FROM articles WHERE url LIKE :pattern"), {"pattern": f"{SEED_PREFIX}%"})
+
+
+def hot_queries(conn) -> dict:
+    today = datetime.utcnow().date()
+    user_id = conn.scalar(select(User.id).limit(1))
+
+    return {
+        # Generator._load_candidate_pool
+        "candidate pool": (
+            "articles",
+            select(Article).where(Article.published_at >= datetime.utcnow() - timedelta(days=7)),
+        ),
+        # Generator.generate_for_users idempotency check
+        "digest idempotency": (
+            "digests",
+            select(Digest)
+            .where(Digest.user_id == str(user_id), Digest.generated_date == today)
+            .limit(1),
+        ),
+        # Cron._enqueue_digest_emails
+        "unsent digests": (
+            "digests",
+            select(Digest).where(
+                Digest.generated_date == today,
+                Digest.email_sent == False,
+                ~exists().where(EmailOutbox.digest_id == Digest.id),
+            ),
+        ),
+        # Interest lookups (interests @> ARRAY[...])
+        "users by interest": (
+            "users",
+            select(User.id).where(
+                User.interests.op("@>")(cast(["topic7"], postgresql.ARRAY(String)))
+            ),
+        ),
+    }
+
+
+def explain(conn, stmt) -> str:
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    rows = conn.exec_driver_sql(f"EXPLAIN {compiled}", compiled.params)
+    return "\n".join(row[0] for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed-articles", type=int, default=0)
+    parser.add_argument("--seed-users", type=int, default=0)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        if args.seed_articles or args.seed_users:
+            seed(conn, args.seed_articles, args.seed_users)
+
+    failed = False
+
+    with engine.connect() as conn:
+        for name, (table, stmt) in hot_queries(conn).items():
+            plan = explain(conn, stmt)
+            ok = f"Seq Scan on {table}" not in plan and "Index" in plan
+            failed |= not ok
+
+            print(f"\n[{'OK' if ok else 'SEQ SCAN'}] {name}")
+            print(plan)
+
+    if args.cleanup:
+        with engine.begin() as conn:
+            cleanup(conn)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
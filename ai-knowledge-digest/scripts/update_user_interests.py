@@ -1,36 +1,34 @@
-
-from app.database.db import SessionLocal
+from app.database.maintenance import ChunkedJob, run_from_cli
 from app.database.models import User
 from app.utils.topics import normalize_interest
-from app.config.logging import logger
 
 
-def main():
-    db = SessionLocal()
-    users = db.query(User).all()
+class UpdateUserInterests(ChunkedJob):
+    """Rewrite User.interests as canonical topics in chunks."""
 
-    updated = 0
+    name = "update_user_interests"
+    model = User
+    columns = (User.email, User.interests)
 
-    for user in users:
+    def transform(self, row):
         new_interests = set()
 
-        for interest in user.interests:
+        for interest in row.interests or []:
             canonical = normalize_interest(interest)
             if canonical:
                 new_interests.add(canonical)
 
-        if new_interests and set(user.interests) != new_interests:
-            logger.info(
-                f"Updating {user.email}: {user.interests} → {list(new_interests)}"
-            )
-            user.interests = list(new_interests)
-            updated += 1
+        if new_interests and set(row.interests) != new_interests:
+            return {"interests": sorted(new_interests)}
+        return None
 
-    db.commit()
-    db.close()
+    def describe(self, row, values):
+        return f"{row.email}: {row.interests} → {values['interests']}"
 
-    logger.info(f"✅ Updated interests for {updated} users")
+
+def main():
+    run_from_cli(UpdateUserInterests)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
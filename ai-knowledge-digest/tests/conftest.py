@@ -0,0 +1,39 @@
+"""
+Fixtures for tests that need the Postgres at DATABASE_URL, migrated to
+head. Everything runs in one outer transaction that is rolled back, so
+the database is untouched.
+"""
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.database.db import engine
+
+
+@pytest.fixture
+def connection():
+    try:
+        connection = engine.connect()
+    except OperationalError as e:
+        pytest.skip(f"Postgres not available: {e}")
+
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+def make_session(connection) -> Session:
+    # commit() inside the code under test only releases a savepoint
+    return Session(bind=connection, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture
+def db(connection):
+    session = make_session(connection)
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,67 @@
+"""
+Queueing digest emails must not issue per-digest queries (N+1).
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.database.db import engine
+from app.database.models import Article, Digest, EmailOutbox, User
+from app.scheduler.cron import Cron
+
+
+def _seed_digests(db, count: int) -> list[uuid.UUID]:
+    articles = [
+        Article(id=uuid.uuid4(), title=f"Article {i}", url=f"https://test.example.com/{uuid.uuid4()}")
+        for i in range(8)
+    ]
+    db.add_all(articles)
+
+    digest_ids = []
+    for i in range(count):
+        user = User(id=uuid.uuid4(), email=f"{uuid.uuid4()}@test.example.com", interests=["ai"])
+        digest = Digest(
+            id=uuid.uuid4(),
+            user=user,
+            generated_date=datetime.utcnow().date(),
+            overview="Overview",
+            article_ids=[a.id for a in articles[i % 4:i % 4 + 5]],
+            email_sent=False,
+        )
+        db.add_all([user, digest])
+        digest_ids.append(digest.id)
+
+    db.commit()
+    return digest_ids
+
+
+def _count_statements(db, digest_count: int) -> int:
+    digest_ids = _seed_digests(db, digest_count)
+
+    cron = Cron.__new__(Cron)  # skip __init__: no processor/generator needed
+    cron.db = db
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        cron._enqueue_digest_emails()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    queued = db.query(EmailOutbox).filter(EmailOutbox.digest_id.in_(digest_ids)).count()
+    assert queued == digest_count
+
+    # Excludes the SAVEPOINT bookkeeping of the test session
+    return sum(1 for s in statements if "SAVEPOINT" not in s)
+
+
+def test_enqueue_query_count_is_constant(db):
+    small = _count_statements(db, 10)
+    large = _count_statements(db, 100)
+
+    assert small == large
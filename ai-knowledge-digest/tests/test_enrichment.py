@@ -0,0 +1,108 @@
+"""
+A fallback summary (provider down, unparseable reply) is a failed
+enrichment attempt, never a finished article; a call shed by the open
+circuit is no attempt at all.
+"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import app.ai.enrichment as enrichment
+from app.ai.circuit import OPEN, CircuitOpenError
+from app.ai.processor import Processor
+from app.database.models import Article
+from tests.conftest import make_session
+
+
+class FallbackProcessor(Processor):
+    """Every article comes back as the placeholder used after the model failed."""
+
+    closed = 0
+
+    def __init__(self):
+        self.client = SimpleNamespace(close=self._close)
+
+    @classmethod
+    def _close(cls):
+        cls.closed += 1
+
+    def summarize_batch(self, texts):
+        return [self._fallback_summary(text) for text in texts]
+
+
+class CircuitOpenProcessor(FallbackProcessor):
+    """The provider's circuit is open: the real single-article path raises."""
+
+    def __init__(self):
+        self.client = SimpleNamespace(
+            close=self._close,
+            api_key="key",
+            breaker=SimpleNamespace(state=OPEN),
+            chat=lambda system, user: {"fallback": True},
+        )
+        self.cache = SimpleNamespace(get=lambda key: None)
+        self.retry_count = 3
+
+    def summarize_batch(self, texts):
+        results = []
+        for text in texts:
+            try:
+                results.append(self.summarize_article(text))
+            except CircuitOpenError as e:
+                results.append(e)
+        return results
+
+
+def _run_worker(connection, monkeypatch, max_attempts: int, processor=FallbackProcessor) -> Article:
+    db = make_session(connection)
+    article = Article(
+        id=uuid.uuid4(),
+        title="Pending article",
+        url=f"https://test.example.com/{uuid.uuid4()}",
+        content_text="Some article text. More of it.",
+        created_at=datetime(2000, 1, 1),  # claimed first
+        enrichment_status="pending",
+        enrichment_attempts=0,
+    )
+    db.add(article)
+    db.commit()
+
+    monkeypatch.setattr(enrichment, "Processor", processor)
+    monkeypatch.setattr(enrichment, "SessionLocal", lambda: make_session(connection))
+
+    enrichment.EnrichmentWorker(workers=1, batch_size=50, max_attempts=max_attempts).run()
+
+    db.expire_all()
+    return db.get(Article, article.id)
+
+
+def test_fallback_leaves_article_pending(connection, monkeypatch):
+    article = _run_worker(connection, monkeypatch, max_attempts=3)
+
+    assert article.enrichment_status == "pending"
+    assert article.enrichment_attempts == 1
+    assert article.summary is None
+
+
+def test_fallback_fails_article_at_max_attempts(connection, monkeypatch):
+    article = _run_worker(connection, monkeypatch, max_attempts=1)
+
+    assert article.enrichment_status == "failed"
+    assert article.enrichment_attempts == 1
+    assert article.summary is None
+
+
+def test_open_circuit_is_not_an_attempt(connection, monkeypatch):
+    article = _run_worker(connection, monkeypatch, max_attempts=1, processor=CircuitOpenProcessor)
+
+    assert article.enrichment_status == "pending"
+    assert article.enrichment_attempts == 0
+    assert article.summary is None
+
+
+def test_worker_closes_its_client(connection, monkeypatch):
+    monkeypatch.setattr(FallbackProcessor, "closed", 0)
+
+    _run_worker(connection, monkeypatch, max_attempts=3)
+
+    assert FallbackProcessor.closed == 1
@@ -0,0 +1,37 @@
+"""
+A batch reply is trusted item by item: anything short of a complete
+summary goes back to the single-article path instead of being padded.
+"""
+import json
+
+from app.ai.processor import Processor
+
+
+def _parse(items):
+    return Processor.__new__(Processor)._safe_parse_batch(json.dumps({"items": items}))
+
+
+def _item(id, **overrides):
+    item = {"id": id, "summary": "A summary.", "takeaways": ["one", "two", "three"], "topic": "ai"}
+    item.update(overrides)
+    return item
+
+
+def test_batch_keeps_complete_items():
+    assert _parse([_item(1)]) == {
+        1: {"summary": "A summary.", "takeaways": ["one", "two", "three"], "topic": "ai"}
+    }
+
+
+def test_batch_drops_incomplete_items():
+    parsed = _parse([
+        _item(1),
+        _item(2, summary=" "),
+        _item(3, takeaways=["one", "two"]),
+        _item(4, takeaways=["one", "two", ""]),
+        _item(5, takeaways=["one", "two", "three", "four"]),
+        _item(6, topic="gardening"),
+        _item(7, topic=None),
+    ])
+
+    assert list(parsed) == [1]
@@ -0,0 +1,32 @@
+"""
+Interest rewriting changes what the ranker matches: the stored interests
+are ranked verbatim, so the canonical topic an alias folds into is pinned.
+"""
+from types import SimpleNamespace
+
+from app.ranking.ranker import ArticleRanker
+from app.utils.topics import expand_interests, normalize_interest
+from scripts.update_user_interests import UpdateUserInterests
+
+
+def test_cloud_interests_fold_into_mlops():
+    assert normalize_interest("cloud") == "mlops"
+    assert normalize_interest("AWS") == "mlops"
+    assert normalize_interest("Machine-Learning") == "ai"
+
+
+def test_interest_phrases_are_not_rewritten():
+    assert normalize_interest("deep learning research") is None
+    assert "ai" in expand_interests(["deep learning research"])
+
+
+def test_rewritten_interests_rank_by_canonical_topic():
+    row = SimpleNamespace(email="user@example.com", interests=["cloud", "aws"])
+    values = UpdateUserInterests(checkpoint=object()).transform(row)
+    assert values == {"interests": ["mlops"]}
+
+    cloud = SimpleNamespace(title="Cloud costs", content_text="Cutting the cloud bill", content_md=None)
+    mlops = SimpleNamespace(title="MLOps at scale", content_text="Shipping mlops pipelines", content_md=None)
+    user = SimpleNamespace(email=row.email, interests=values["interests"])
+
+    assert ArticleRanker().rank([cloud, mlops], user) == [mlops, cloud]